@@ -179,6 +179,13 @@ class CliApp:
     async def initialize(self):
         await self.refresh_resources()
         await self.refresh_prompts()
+        await self.refresh_tool_routes()
+
+    async def refresh_tool_routes(self):
+        try:
+            await self.agent.build_tool_routes()
+        except Exception as e:
+            print(f"Error building tool routes: {e}")
 
     async def refresh_resources(self):
         try:
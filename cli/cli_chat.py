@@ -1,5 +1,7 @@
+import asyncio
+import logging
 from typing import List, Tuple
-from mcp.types import Prompt, PromptMessage
+from mcp.types import Prompt, PromptMessage, TextContent
 from anthropic.types import MessageParam
 
 # Add parent directory to path for imports
@@ -12,6 +14,38 @@ from cli.chat import Chat
 from cli.claude import Claude
 from .mcp_client import MCPClient
 
+logger = logging.getLogger(__name__)
+
+# CLI shorthand -> MCP tool name for Discord-specific commands
+_DISCORD_COMMANDS = {
+    "send": "discord_send_message",
+    "channel": "discord_get_channel_info",
+}
+
+# Prompt scaffolding for non-command queries; only query/added_resources vary
+_PROMPT_TEMPLATE = """
+        The user has a question:
+        <query>
+        {query}
+        </query>
+
+        The following context may be useful in answering their question:
+        <context>
+        {added_resources}
+        </context>
+
+        Note: You have access to Discord tools that can be used to interact with Discord:
+        - discord_send_message: Send a message to a Discord channel
+        - discord_get_channel_info: Get information about a Discord channel
+
+        If the user is asking to send a message or get channel information, suggest using
+        the appropriate command format:
+        - "send [channel_id] [message]" to send a message
+        - "channel [channel_id]" to get channel information
+
+        Answer the user's question directly and concisely. Start with the exact information they need.
+        """
+
 
 class CliChat(Chat):
     def __init__(
@@ -24,12 +58,22 @@ class CliChat(Chat):
 
         self.discord_client: MCPClient = discord_client
 
+        # tool name -> (client name, client) routing index, built lazily
+        # or from CliApp.initialize
+        self._tool_routes: dict[str, tuple[str, MCPClient]] | None = None
+
+        # CLI shorthand -> handler coroutine for Discord-specific commands
+        self._discord_handlers = {
+            "send": self._handle_send,
+            "channel": self._handle_channel_info,
+        }
+
     async def list_prompts(self) -> list[Prompt]:
         # Try to get prompts from the discord_client, but handle if there are none
         try:
             return await self.discord_client.list_prompts()
         except Exception as e:
-            print(f"Warning: Could not list prompts: {e}")
+            logger.warning("Could not list prompts: %s", e)
             return []
 
     async def list_docs_ids(self) -> list[str]:
@@ -58,7 +102,7 @@ class CliChat(Chat):
         try:
             return await self.discord_client.get_prompt(command, {"doc_id": doc_id})
         except Exception as e:
-            print(f"Warning: Could not get prompt: {e}")
+            logger.warning("Could not get prompt: %s", e)
             return []
 
     async def _extract_resources(self, query: str) -> str:
@@ -78,11 +122,10 @@ class CliChat(Chat):
         # )
         return ""
 
-    async def _process_command(self, query: str) -> bool:
-        if not query.startswith("/"):
+    async def _process_command(self, query: str, words: list[str]) -> bool:
+        if not query or query[0] != "/":
             return False
 
-        words = query.split()
         command = words[0].replace("/", "")
 
         try:
@@ -93,251 +136,210 @@ class CliChat(Chat):
             self.messages += convert_prompt_messages_to_message_params(messages)
             return True
         except Exception as e:
-            print(f"Warning: Could not process command: {e}")
+            logger.warning("Could not process command: %s", e)
             return False
 
-    async def _process_query(self, query: str):
-        # Check if this is a command first
-        if await self._process_command(query):
-            return
+    async def build_tool_routes(self) -> None:
+        """Build the tool-name -> client routing index.
 
-        # # Try to extract resources (keeping for compatibility)
-        added_resources = await self._extract_resources(query)
+        Queries all MCP clients concurrently so total latency is the
+        slowest round-trip, not the sum of all of them. The first client
+        to expose a tool name wins, matching the old scan order.
+        """
+        candidates = [
+            (client_name, client)
+            for client_name, client in self.clients.items()
+            if hasattr(client, "list_tools")
+        ]
+        results = await asyncio.gather(
+            *(client.list_tools() for _, client in candidates),
+            return_exceptions=True,
+        )
+        routes: dict[str, tuple[str, MCPClient]] = {}
+        for (client_name, client), tools in zip(candidates, results):
+            if isinstance(tools, BaseException):
+                logger.warning(
+                    "Error listing tools for client %s: %s", client_name, tools
+                )
+                continue
+            for tool in tools:
+                routes.setdefault(tool.name, (client_name, client))
+        self._tool_routes = routes
+
+    def invalidate_tool_routes(self) -> None:
+        """Drop the routing index, e.g. after a client reconnects."""
+        self._tool_routes = None
+
+    async def _find_tool_client(self, tool_name: str):
+        """Look up which client owns the given tool via the routing index."""
+        if self._tool_routes is None:
+            await self.build_tool_routes()
+        return self._tool_routes.get(tool_name, (None, None))
+
+    def _append_exchange(self, user_content: str, assistant_content: str) -> None:
+        """Record a handled command as a user/assistant message pair."""
+        self.messages.append({"role": "user", "content": user_content})
+        self.messages.append({"role": "assistant", "content": assistant_content})
+
+    async def _handle_send(self, words: list[str]) -> bool:
+        """Handle 'send [channel_id] [message]'; returns True when handled."""
+        if len(words) < 3:
+            return False
 
-        # Check if this is a Discord-specific command
-        discord_commands = {
-            "send": "discord_send_message",
-            "channel": "discord_get_channel_info",
-        }
+        channel_id = words[1]
+        message = words[2]
+        command = _DISCORD_COMMANDS["send"]
 
-        words = query.split()
-        if len(words) >= 2 and words[0].lower() in discord_commands:
-            command = discord_commands[words[0].lower()]
+        logger.debug(
+            "Processing send command: channel_id=%s, message=%s",
+            channel_id,
+            message,
+        )
 
-            # Handle discord_send_message
-            if command == "discord_send_message" and len(words) >= 3:
-                channel_id = words[1]
-                message = " ".join(words[2:])
+        # First try to use the direct method on the Discord bot
+        discord_bot = self.clients.get("discord_bot")
+        if discord_bot and hasattr(discord_bot, "send_direct_message"):
+            logger.debug("Using direct method on Discord bot")
+            try:
+                result = await discord_bot.send_direct_message(
+                    channel_id, message, mention_everyone=False
+                )
+                logger.debug("Direct message result: %s", result)
 
-                print(
-                    f"Processing send command: channel_id={channel_id}, message={message}"
+                if result.get("success", False):
+                    self._append_exchange(
+                        f"Send message '{message}' to channel {channel_id}",
+                        f"Message sent successfully to channel {channel_id}.",
+                    )
+                    return True
+                else:
+                    logger.warning(
+                        "Direct message failed: %s",
+                        result.get("error", "Unknown error"),
+                    )
+            except Exception:
+                logger.exception("Error sending direct message")
+
+        # If direct method failed or not available, try using the MCP tools
+        logger.debug("Available clients: %s", list(self.clients.keys()))
+        client_name, client = await self._find_tool_client(command)
+        if client is not None:
+            logger.debug("Found tool %s in client %s, calling it", command, client_name)
+            try:
+                result = await client.call_tool(
+                    command,
+                    {
+                        "channel_id": channel_id,
+                        "message": message,
+                        "mention_everyone": False,
+                    },
                 )
+                logger.debug("Tool call result: %s", result)
 
-                # First try to use the direct method on the Discord bot
-                discord_bot = self.clients.get("discord_bot")
-                if discord_bot and hasattr(discord_bot, "send_direct_message"):
-                    print(f"Using direct method on Discord bot")
-                    try:
-                        result = await discord_bot.send_direct_message(
-                            channel_id, message, mention_everyone=False
-                        )
-                        print(f"Direct message result: {result}")
-
-                        if result.get("success", False):
-                            # Add the result to the conversation
-                            self.messages.append(
-                                {
-                                    "role": "user",
-                                    "content": f"Send message '{message}' to channel {channel_id}",
-                                }
-                            )
-                            self.messages.append(
-                                {
-                                    "role": "assistant",
-                                    "content": f"Message sent successfully to channel {channel_id}.",
-                                }
-                            )
-                            return
-                        else:
-                            print(
-                                f"Direct message failed: {result.get('error', 'Unknown error')}"
-                            )
-                    except Exception as e:
-                        print(f"Error sending direct message: {e}")
-                        import traceback
-
-                        print(f"Traceback: {traceback.format_exc()}")
-
-                # If direct method failed or not available, try using the MCP tools
-                print(f"Available clients: {list(self.clients.keys())}")
-                for client_name, client in self.clients.items():
-                    print(f"Trying client: {client_name}, type: {type(client)}")
-                    try:
-                        if not hasattr(client, "list_tools"):
-                            print(
-                                f"Client {client_name} doesn't have list_tools method, skipping"
-                            )
-                            continue
-
-                        print(f"Getting tools for client {client_name}")
-                        tools = await client.list_tools()
-                        tool_names = [tool.name for tool in tools]
-                        print(f"Available tools for client {client_name}: {tool_names}")
-
-                        if command in tool_names:
-                            print(
-                                f"Found tool {command} in client {client_name}, calling it"
-                            )
-                            result = await client.call_tool(
-                                command,
-                                {
-                                    "channel_id": channel_id,
-                                    "message": message,
-                                    "mention_everyone": False,
-                                },
-                            )
-                            print(f"Tool call result: {result}")
-
-                            # Add the result to the conversation
-                            self.messages.append(
-                                {
-                                    "role": "user",
-                                    "content": f"Send message '{message}' to channel {channel_id}",
-                                }
-                            )
-                            self.messages.append(
-                                {
-                                    "role": "assistant",
-                                    "content": f"Message sent successfully to channel {channel_id}.",
-                                }
-                            )
-                            return
-                    except Exception as e:
-                        print(
-                            f"Error calling Discord tool with client {client_name}: {e}"
+                self._append_exchange(
+                    f"Send message '{message}' to channel {channel_id}",
+                    f"Message sent successfully to channel {channel_id}.",
+                )
+                return True
+            except Exception:
+                logger.exception(
+                    "Error calling Discord tool with client %s", client_name
+                )
+
+        return False
+
+    async def _handle_channel_info(self, words: list[str]) -> bool:
+        """Handle 'channel [channel_id]'; returns True when handled."""
+        if len(words) < 2:
+            return False
+
+        channel_id = words[1]
+        command = _DISCORD_COMMANDS["channel"]
+
+        logger.debug("Processing channel info command: channel_id=%s", channel_id)
+
+        # First try to use the direct method on the Discord bot
+        discord_bot = self.clients.get("discord_bot")
+        if discord_bot and hasattr(discord_bot, "get_channel_info"):
+            logger.debug("Using direct method on Discord bot for channel info")
+            try:
+                result = await discord_bot.get_channel_info(channel_id)
+                logger.debug("Direct channel info result: %s", result)
+
+                if result.get("success", False):
+                    # Format the channel info nicely
+                    channel_info = (
+                        f"Channel ID: {result['id']}\n"
+                        f"Name: {result['name']}\n"
+                        f"Type: {result['type']}\n"
+                        f"Topic: {result['topic'] or 'No topic'}\n"
+                        f"NSFW: {result['nsfw']}\n"
+                        f"Position: {result['position']}\n"
+                        f"Created at: {result['created_at']}"
+                    )
+
+                    self._append_exchange(
+                        f"Get information about channel {channel_id}",
+                        f"Channel information:\n{channel_info}",
+                    )
+                    return True
+                else:
+                    logger.warning(
+                        "Direct channel info failed: %s",
+                        result.get("error", "Unknown error"),
+                    )
+            except Exception:
+                logger.exception("Error getting channel info")
+
+        # If direct method failed or not available, try using the MCP tools
+        logger.debug("Available clients: %s", list(self.clients.keys()))
+        client_name, client = await self._find_tool_client(command)
+        if client is not None:
+            logger.debug("Found tool %s in client %s, calling it", command, client_name)
+            try:
+                result = await client.call_tool(command, {"channel_id": channel_id})
+                logger.debug("Tool call result: %s", result)
+
+                # Extract the text content from the result
+                content = "Channel information not available"
+                if getattr(result, "content", None):
+                    content = (
+                        "\n".join(
+                            item.text
+                            for item in result.content
+                            if isinstance(item, TextContent)
                         )
-                        import traceback
-
-                        print(f"Traceback: {traceback.format_exc()}")
-
-            # Handle discord_get_channel_info
-            elif command == "discord_get_channel_info" and len(words) >= 2:
-                channel_id = words[1]
-
-                print(f"Processing channel info command: channel_id={channel_id}")
-
-                # First try to use the direct method on the Discord bot
-                discord_bot = self.clients.get("discord_bot")
-                if discord_bot and hasattr(discord_bot, "get_channel_info"):
-                    print(f"Using direct method on Discord bot for channel info")
-                    try:
-                        result = await discord_bot.get_channel_info(channel_id)
-                        print(f"Direct channel info result: {result}")
-
-                        if result.get("success", False):
-                            # Format the channel info nicely
-                            channel_info = (
-                                f"Channel ID: {result['id']}\n"
-                                f"Name: {result['name']}\n"
-                                f"Type: {result['type']}\n"
-                                f"Topic: {result['topic'] or 'No topic'}\n"
-                                f"NSFW: {result['nsfw']}\n"
-                                f"Position: {result['position']}\n"
-                                f"Created at: {result['created_at']}"
-                            )
-
-                            # Add the result to the conversation
-                            self.messages.append(
-                                {
-                                    "role": "user",
-                                    "content": f"Get information about channel {channel_id}",
-                                }
-                            )
-                            self.messages.append(
-                                {
-                                    "role": "assistant",
-                                    "content": f"Channel information:\n{channel_info}",
-                                }
-                            )
-                            return
-                        else:
-                            print(
-                                f"Direct channel info failed: {result.get('error', 'Unknown error')}"
-                            )
-                    except Exception as e:
-                        print(f"Error getting channel info: {e}")
-                        import traceback
-
-                        print(f"Traceback: {traceback.format_exc()}")
-
-                # If direct method failed or not available, try using the MCP tools
-                print(f"Available clients: {list(self.clients.keys())}")
-                for client_name, client in self.clients.items():
-                    try:
-                        if not hasattr(client, "list_tools"):
-                            print(
-                                f"Client {client_name} doesn't have list_tools method, skipping"
-                            )
-                            continue
-
-                        print(f"Getting tools for client {client_name}")
-                        tools = await client.list_tools()
-                        tool_names = [tool.name for tool in tools]
-                        print(f"Available tools for client {client_name}: {tool_names}")
-
-                        if command in tool_names:
-                            print(
-                                f"Found tool {command} in client {client_name}, calling it"
-                            )
-                            result = await client.call_tool(
-                                command, {"channel_id": channel_id}
-                            )
-                            print(f"Tool call result: {result}")
-
-                            # Extract the content from the result
-                            content = "Channel information not available"
-                            if hasattr(result, "content") and result.content:
-                                content_items = [
-                                    item.text
-                                    for item in result.content
-                                    if hasattr(item, "text")
-                                ]
-                                if content_items:
-                                    content = "\n".join(content_items)
-
-                            # Add the result to the conversation
-                            self.messages.append(
-                                {
-                                    "role": "user",
-                                    "content": f"Get information about channel {channel_id}",
-                                }
-                            )
-                            self.messages.append(
-                                {
-                                    "role": "assistant",
-                                    "content": f"Channel information:\n{content}",
-                                }
-                            )
-                            return
-                    except Exception as e:
-                        print(f"Error calling Discord tool: {e}")
-                        import traceback
-
-                        print(f"Traceback: {traceback.format_exc()}")
+                        or content
+                    )
 
-        # If not a Discord command, process as a regular query
-        prompt = f"""
-        The user has a question:
-        <query>
-        {query}
-        </query>
+                self._append_exchange(
+                    f"Get information about channel {channel_id}",
+                    f"Channel information:\n{content}",
+                )
+                return True
+            except Exception:
+                logger.exception("Error calling Discord tool")
 
-        The following context may be useful in answering their question:
-        <context>
-        {added_resources}
-        </context>
+        return False
 
-        Note: You have access to Discord tools that can be used to interact with Discord:
-        - discord_send_message: Send a message to a Discord channel
-        - discord_get_channel_info: Get information about a Discord channel
+    async def _process_query(self, query: str):
+        # Split once: command word, channel id, and the rest of the message
+        words = query.split(maxsplit=2)
 
-        If the user is asking to send a message or get channel information, suggest using
-        the appropriate command format:
-        - "send [channel_id] [message]" to send a message
-        - "channel [channel_id]" to get channel information
+        # Check if this is a command first
+        if await self._process_command(query, words):
+            return
 
-        Answer the user's question directly and concisely. Start with the exact information they need.
-        """
+        # # Try to extract resources (keeping for compatibility)
+        added_resources = await self._extract_resources(query)
+
+        # Dispatch Discord-specific commands through the handler table
+        handler = self._discord_handlers.get(words[0].lower()) if words else None
+        if handler is not None and await handler(words):
+            return
+
+        # If not a Discord command, process as a regular query
+        prompt = _PROMPT_TEMPLATE.format(query=query, added_resources=added_resources)
 
         self.messages.append({"role": "user", "content": prompt})
 
@@ -349,39 +351,19 @@ def convert_prompt_message_to_message_param(
 
     content = prompt_message.content
 
-    # Check if content is a dict-like object with a "type" field
-    if isinstance(content, dict) or hasattr(content, "__dict__"):
-        content_type = (
-            content.get("type", None)
-            if isinstance(content, dict)
-            else getattr(content, "type", None)
-        )
-        if content_type == "text":
-            content_text = (
-                content.get("text", "")
-                if isinstance(content, dict)
-                else getattr(content, "text", "")
-            )
-            return {"role": role, "content": content_text}
+    # At runtime the content is an MCP TextContent model (or a plain dict
+    # with the same shape), so a type check beats getattr probing
+    if isinstance(content, TextContent):
+        return {"role": role, "content": content.text}
+    if isinstance(content, dict) and content.get("type") == "text":
+        return {"role": role, "content": content.get("text", "")}
 
     if isinstance(content, list):
-        text_blocks = []
-        for item in content:
-            # Check if item is a dict-like object with a "type" field
-            if isinstance(item, dict) or hasattr(item, "__dict__"):
-                item_type = (
-                    item.get("type", None)
-                    if isinstance(item, dict)
-                    else getattr(item, "type", None)
-                )
-                if item_type == "text":
-                    item_text = (
-                        item.get("text", "")
-                        if isinstance(item, dict)
-                        else getattr(item, "text", "")
-                    )
-                    text_blocks.append({"type": "text", "text": item_text})
-
+        text_blocks = [
+            {"type": "text", "text": item.text}
+            for item in content
+            if isinstance(item, TextContent)
+        ]
         if text_blocks:
             return {"role": role, "content": text_blocks}
 
@@ -2,7 +2,7 @@ import asyncio
 import sys
 import os
 from dotenv import load_dotenv
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, asynccontextmanager
 
 # Add parent directory to path for imports
 import sys
@@ -33,39 +33,52 @@ assert discord_token, "Error: DISCORD_TOKEN cannot be empty. Update .env"
 discord_bot = None
 
 
+@asynccontextmanager
+async def managed_bot(token: str):
+    """Run a DiscordMCPBot for the lifetime of the context.
+
+    The bot is closed and its task reaped in the same task that entered
+    the context, so shutdown is deterministic and runs in LIFO order on
+    the exit stack instead of racing a dangling background task.
+    """
+    bot = DiscordMCPBot()
+    task = asyncio.create_task(bot.start(token))
+    try:
+        # Wake on whichever happens first: the gateway is ready, or the
+        # start task died (e.g. bad token) and its error should surface
+        ready = asyncio.ensure_future(bot.wait_until_ready())
+        done, _ = await asyncio.wait({task, ready}, return_when=asyncio.FIRST_COMPLETED)
+        if task in done:
+            ready.cancel()
+            task.result()
+        yield bot
+    finally:
+        await bot.close()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
 async def main():
     claude_service = Claude(model=claude_model)
 
     server_scripts = sys.argv[1:]
     clients = {}
 
-    # Set environment variable to pass the Discord bot to the MCP server
-    os.environ["DISCORD_BOT_AVAILABLE"] = "1"
-
     command, args = (
         ("uv", ["run", "src/discord_mcp/server.py"])
         if os.getenv("USE_UV", "0") == "1"
         else ("python", ["src/discord_mcp/server.py"])
     )
 
-    # Initialize Discord bot
-    global discord_bot
-    discord_bot = DiscordMCPBot()
-    # Start the bot in the background
     print("Starting Discord bot...")
-    try:
-        # Make sure the bot is available globally
-        sys.modules["__main__"].discord_bot = discord_bot
-
-        bot_task = asyncio.create_task(discord_bot.start(discord_token))
-        print("Discord bot task created successfully")
-    except Exception as e:
-        print(f"Error starting Discord bot: {e}")
-        print(f"Token length: {len(discord_token)}")
-        print(f"First few characters of token: {discord_token[:5]}...")
-        bot_task = None
 
+    global discord_bot
     async with AsyncExitStack() as stack:
+        # The bot is just another managed resource on the stack; its
+        # close/cancel cleanup runs last, after the MCP clients exit
+        discord_bot = await stack.enter_async_context(managed_bot(discord_token))
+        print("Discord bot connected")
+
         discord_client = await stack.enter_async_context(
             MCPClient(command=command, args=args)
         )
@@ -81,9 +94,6 @@ async def main():
         # Store Discord bot reference for tool access
         clients["discord_bot"] = discord_bot
 
-        # Pass the Discord bot to the MCP server via environment variable
-        os.environ["DISCORD_BOT_MODULE"] = "__main__"
-
         chat = CliChat(
             discord_client=discord_client,
             clients=clients,
@@ -93,16 +103,19 @@ async def main():
         cli = CliApp(chat)
         await cli.initialize()
 
-        try:
-            await cli.run()
-        finally:
-            # Ensure bot is closed properly when CLI exits
-            if not bot_task.done():
-                await discord_bot.close()  # Await the close coroutine
-                await bot_task
+        await cli.run()
 
 
 if __name__ == "__main__":
     if sys.platform == "win32":
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # uvloop's libuv-based loop cuts scheduler overhead for the
+        # socket-heavy gateway + stdio workload; optional extra
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
     asyncio.run(main())
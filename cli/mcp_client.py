@@ -2,6 +2,7 @@ import sys
 import os
 import asyncio
 import json
+from functools import lru_cache
 from pydantic import AnyUrl
 from typing import Optional, Any
 from contextlib import AsyncExitStack
@@ -9,6 +10,12 @@ from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client
 
 
+@lru_cache(maxsize=128)
+def _parse_uri(uri: str) -> AnyUrl:
+    """Parse a resource URI once; the CLI reuses the same URIs a lot."""
+    return AnyUrl(uri)
+
+
 class MCPClient:
     def __init__(
         self,
@@ -21,6 +28,7 @@ class MCPClient:
         self._env = env or {}
         self._session: Optional[ClientSession] = None
         self._exit_stack: AsyncExitStack = AsyncExitStack()
+        self._tools_cache: Optional[list[types.Tool]] = None
 
         # Set default environment variables if not provided
         if (
@@ -52,9 +60,14 @@ class MCPClient:
         return self._session
 
     async def list_tools(self) -> list[types.Tool]:
+        # The tool list is static for the lifetime of a session, so one
+        # JSON-RPC round-trip is enough; later calls are served from memory.
+        if self._tools_cache is not None:
+            return self._tools_cache
         result = await self.session().list_tools()
         if result is None:
             raise RuntimeError("Failed to retrieve tools from the MCP server.")
+        self._tools_cache = result.tools
         return result.tools
 
     async def call_tool(
@@ -79,8 +92,10 @@ class MCPClient:
             )
         return result.messages
 
-    async def read_resource(self, uri: str) -> Any:
-        result = await self.session().read_resource(AnyUrl(uri))
+    async def read_resource(self, uri: str | AnyUrl) -> Any:
+        # Only run pydantic URL validation when given a raw string
+        url = uri if isinstance(uri, AnyUrl) else _parse_uri(uri)
+        result = await self.session().read_resource(url)
         resource = result.contents[0]
 
         if isinstance(resource, types.TextResourceContents):
@@ -92,6 +107,7 @@ class MCPClient:
     async def cleanup(self):
         await self._exit_stack.aclose()
         self._session = None
+        self._tools_cache = None
 
     async def __aenter__(self):
         await self.connect()
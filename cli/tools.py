@@ -1,9 +1,23 @@
-import json
 from typing import Optional, Literal, List
 from mcp.types import CallToolResult, Tool, TextContent
 from .mcp_client import MCPClient
 from anthropic.types import Message, ToolResultBlockParam
 
+# Tool results are re-serialized once per call before being handed to
+# Claude; orjson (the "perf" extra) does this in C, with stdlib json as
+# the fallback when it isn't installed
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj)
+
 
 class ToolManager:
     @classmethod
@@ -94,7 +108,7 @@ class ToolManager:
                 content_list = [
                     item.text for item in items if isinstance(item, TextContent)
                 ]
-                content_json = json.dumps(content_list)
+                content_json = _dumps(content_list)
                 tool_result_part = cls._build_tool_result_part(
                     tool_use_id,
                     content_json,
@@ -105,7 +119,7 @@ class ToolManager:
                 print(error_message)
                 tool_result_part = cls._build_tool_result_part(
                     tool_use_id,
-                    json.dumps({"error": error_message}),
+                    _dumps({"error": error_message}),
                     ("error" if tool_output and tool_output.isError else "success"),
                 )
 
@@ -5,6 +5,7 @@ Use this for development, testing, and running MCP inspector
 """
 
 import asyncio
+import runpy
 import sys
 import os
 from pathlib import Path
@@ -18,8 +19,8 @@ def run_mcp_inspector():
     print("🔍 Starting MCP Inspector for Discord MCP")
     print("This will start the MCP server and inspector for development")
 
-    # Run the MCP server with inspector
-    os.system("python -m src.discord_mcp.server")
+    # Run the MCP server in-process; avoids forking a fresh interpreter
+    runpy.run_module("src.discord_mcp.server", run_name="__main__")
 
 
 def run_server_directly():
@@ -39,10 +40,16 @@ def run_tests():
         "debug_guilds.py",
     ]
 
-    for test_file in test_files:
-        if os.path.exists(test_file):
-            print(f"\n▶️ Running {test_file}...")
-            os.system(f"python {test_file}")
+    existing = [f for f in test_files if os.path.exists(f)]
+    if not existing:
+        print("No test files found")
+        return
+
+    # One in-process pytest session shares the heavy discord/mcp imports
+    # across files instead of paying interpreter startup per script
+    import pytest
+
+    pytest.main(existing)
 
 
 def show_help():
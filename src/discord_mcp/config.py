@@ -1,7 +1,8 @@
 """Configuration management for Discord MCP server."""
 
 import os
-from typing import List, Optional
+from functools import cached_property
+from typing import FrozenSet, Optional
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,7 +17,11 @@ class Config:
         """Initialize configuration from environment variables."""
         self._validate_required_env_vars()
 
-    @property
+    # Each setting is a cached_property: the environment is read and
+    # parsed once per Config instance instead of on every access, which
+    # matters for is_guild_allowed running per guild per tool call
+
+    @cached_property
     def discord_token(self) -> str:
         """Discord bot token."""
         token = os.getenv("DISCORD_TOKEN")
@@ -24,22 +29,22 @@ class Config:
             raise ValueError("DISCORD_TOKEN environment variable is required")
         return token
 
-    @property
-    def guild_allowlist(self) -> Optional[List[str]]:
-        """List of allowed guild IDs. If None, all guilds are allowed."""
+    @cached_property
+    def guild_allowlist(self) -> Optional[FrozenSet[str]]:
+        """Set of allowed guild IDs. If None, all guilds are allowed."""
         allowlist = os.getenv("GUILD_ALLOWLIST")
         if not allowlist:
             return None
-        return [
+        return frozenset(
             guild_id.strip() for guild_id in allowlist.split(",") if guild_id.strip()
-        ]
+        )
 
-    @property
+    @cached_property
     def log_level(self) -> str:
         """Logging level."""
         return os.getenv("LOG_LEVEL", "INFO").upper()
 
-    @property
+    @cached_property
     def dry_run(self) -> bool:
         """Whether to run in dry-run mode (mock Discord API calls)."""
         return os.getenv("DRY_RUN", "false").lower() in (
@@ -49,7 +54,7 @@ class Config:
             "on",
         )
 
-    @property
+    @cached_property
     def database_path(self) -> Path:
         """Path to SQLite database file."""
         db_path = os.getenv("MCP_DISCORD_DB_PATH", "discord_mcp.db")
@@ -86,6 +91,5 @@ class Config:
 
     def is_guild_allowed(self, guild_id: str) -> bool:
         """Check if a guild ID is in the allowlist."""
-        if self.guild_allowlist is None:
-            return True
-        return guild_id in self.guild_allowlist
+        allowlist = self.guild_allowlist
+        return allowlist is None or guild_id in allowlist
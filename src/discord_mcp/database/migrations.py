@@ -58,24 +58,102 @@ class CampaignMigrations:
             """,
             # Migration 4: Create indexes for performance
             """
-            CREATE INDEX IF NOT EXISTS idx_campaigns_status
-            ON campaigns (status);
+            CREATE INDEX IF NOT EXISTS idx_optins_campaign_id
+            ON optins (campaign_id);
             """,
             """
-            CREATE INDEX IF NOT EXISTS idx_campaigns_remind_at
-            ON campaigns (remind_at);
+            CREATE INDEX IF NOT EXISTS idx_reminders_log_campaign_id
+            ON reminders_log (campaign_id);
             """,
+            # Migration 5: Integer epoch column for due-campaign scans.
+            # The due poll compared ISO-8601 text lexicographically;
+            # integer comparisons are cheaper and the index nodes
+            # smaller. The 'utc' modifier makes the backfill interpret
+            # stored naive timestamps as local time, matching what
+            # datetime.timestamp() binds from Python.
             """
-            CREATE INDEX IF NOT EXISTS idx_optins_campaign_id
-            ON optins (campaign_id);
+            ALTER TABLE campaigns ADD COLUMN remind_at_ts INTEGER;
             """,
             """
-            CREATE INDEX IF NOT EXISTS idx_optins_user_id
-            ON optins (user_id);
+            UPDATE campaigns
+            SET remind_at_ts = CAST(strftime('%s', remind_at, 'utc') AS INTEGER)
+            WHERE remind_at_ts IS NULL AND remind_at IS NOT NULL;
             """,
+            # Migration 6: Keyset-pagination index — opt-in pages seek
+            # by (campaign_id, id) with integer compares instead of
+            # scanning user_id text
             """
-            CREATE INDEX IF NOT EXISTS idx_reminders_log_campaign_id
-            ON reminders_log (campaign_id);
+            CREATE INDEX IF NOT EXISTS idx_optins_campaign_rowid
+            ON optins (campaign_id, id);
+            """,
+            # Migration 7: Denormalized opt-in counter — COUNT(*) per
+            # status display walked the optins index; triggers keep a
+            # counter on campaigns so the count is a point lookup. The
+            # backfill recomputes on every boot, which also self-heals
+            # any drift.
+            """
+            ALTER TABLE campaigns ADD COLUMN optin_count INTEGER NOT NULL DEFAULT 0;
+            """,
+            """
+            UPDATE campaigns
+            SET optin_count = (
+                SELECT COUNT(*) FROM optins WHERE optins.campaign_id = campaigns.id
+            );
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_optins_count_insert
+            AFTER INSERT ON optins
+            BEGIN
+                UPDATE campaigns SET optin_count = optin_count + 1
+                WHERE id = NEW.campaign_id;
+            END;
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS trg_optins_count_delete
+            AFTER DELETE ON optins
+            BEGIN
+                UPDATE campaigns SET optin_count = optin_count - 1
+                WHERE id = OLD.campaign_id;
+            END;
+            """,
+            # Migration 8: No query filters on user_id alone — the
+            # UNIQUE(campaign_id, user_id) constraint index and the
+            # keyset index above cover everything — so each opt-in
+            # write was maintaining one B-tree for nothing
+            """
+            DROP INDEX IF EXISTS idx_optins_user_id;
+            """,
+            # Migration 9: The due poll filters status='active' AND
+            # remind_at_ts <= ?; a partial index holds only active
+            # rows, so the scheduler scan scales with active campaigns
+            # rather than lifetime campaigns. Status listings filter
+            # status and order by remind_at, which the composite
+            # serves without a sort step; the superseded single-column
+            # indexes are dropped.
+            """
+            CREATE INDEX IF NOT EXISTS idx_campaigns_due
+            ON campaigns (remind_at_ts) WHERE status = 'active';
+            """,
+            """
+            CREATE INDEX IF NOT EXISTS idx_campaigns_status_remind_at
+            ON campaigns (status, remind_at);
+            """,
+            """
+            DROP INDEX IF EXISTS idx_campaigns_status;
+            """,
+            """
+            DROP INDEX IF EXISTS idx_campaigns_remind_at;
+            """,
+            """
+            DROP INDEX IF EXISTS idx_campaigns_remind_at_ts;
+            """,
+            # Without sqlite_stat1 the planner's default cost model
+            # prefers the status equality index plus a sort over the
+            # partial index's range scan; rerunning ANALYZE each boot
+            # keeps the stats fresh so the partial index actually gets
+            # picked (milliseconds at this database's size)
+            """
+            ANALYZE;
             """,
         ]
 
@@ -88,13 +166,26 @@ class CampaignMigrations:
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
 
-                # Run each migration
+                # One explicit transaction for the whole list: DDL
+                # autocommits statement-by-statement otherwise, paying
+                # a schema-cookie bump and fsync per migration on a
+                # cold start. A loop rather than executescript so a
+                # duplicate-column ALTER can be skipped without
+                # aborting the rest (prepare-time errors leave the
+                # transaction intact).
+                cursor.execute("BEGIN")
                 for i, migration in enumerate(self.get_migrations(), 1):
                     try:
                         cursor.execute(migration)
                         logger.debug(f"Migration {i} completed successfully")
                     except sqlite3.Error as e:
+                        # ALTER TABLE has no IF NOT EXISTS; a duplicate
+                        # column just means the migration already ran
+                        if "duplicate column name" in str(e):
+                            logger.debug(f"Migration {i} already applied")
+                            continue
                         logger.error(f"Migration {i} failed: {e}")
+                        conn.rollback()
                         return False
 
                 conn.commit()
@@ -111,17 +202,19 @@ class CampaignMigrations:
             with sqlite3.connect(str(self.db_path)) as conn:
                 cursor = conn.cursor()
 
-                # Check if all required tables exist
+                # Check if all required tables exist — one sqlite_master
+                # lookup for the whole set instead of a query per table
                 required_tables = ["campaigns", "optins", "reminders_log"]
 
-                for table in required_tables:
-                    cursor.execute(
-                        "SELECT name FROM sqlite_master WHERE type='table' AND name=?",
-                        (table,),
-                    )
-                    if not cursor.fetchone():
-                        logger.error(f"Table '{table}' does not exist")
-                        return False
+                cursor.execute(
+                    "SELECT name FROM sqlite_master"
+                    " WHERE type='table' AND name IN (?, ?, ?)",
+                    required_tables,
+                )
+                missing = set(required_tables) - {row[0] for row in cursor.fetchall()}
+                if missing:
+                    logger.error(f"Tables do not exist: {', '.join(sorted(missing))}")
+                    return False
 
                 logger.info("Campaign schema verification passed")
                 return True
@@ -1,13 +1,31 @@
 """Database models for Discord MCP campaigns."""
 
 import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pathlib import Path
 
-
-@dataclass
+# Column converters keyed on declared types: with PARSE_DECLTYPES the
+# sqlite3 layer hands back datetime/bool values directly, so result
+# loops skip a Python-level fromisoformat ternary per timestamp column
+sqlite3.register_converter(
+    "TIMESTAMP", lambda value: datetime.fromisoformat(value.decode())
+)
+sqlite3.register_converter("BOOLEAN", lambda value: value != b"0")
+# The matching adapter lets write paths bind datetime objects as-is —
+# conversion happens once in the sqlite3 layer instead of via
+# .isoformat() ternaries at every call site (and sqlite3's built-in
+# datetime adapter is deprecated since Python 3.12)
+sqlite3.register_adapter(datetime, datetime.isoformat)
+
+
+# slots=True: campaign and opt-in rows are materialized in bulk by
+# the repository fetch loops, and slotted instances skip the per-
+# instance __dict__ — smaller and faster to construct
+@dataclass(slots=True)
 class Campaign:
     """Campaign model for reaction opt-in reminders."""
 
@@ -34,7 +52,7 @@ class Campaign:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class OptIn:
     """OptIn model for campaign participants."""
 
@@ -55,7 +73,7 @@ class OptIn:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReminderLog:
     """ReminderLog model for tracking sent reminders."""
 
@@ -81,25 +99,117 @@ class ReminderLog:
 
 
 class DatabaseConnection:
-    """Database connection manager for campaigns."""
+    """Database connection manager for campaigns.
+
+    Under WAL one writer and many readers can run concurrently, so
+    writes share a single connection serialized by a lock while each
+    thread gets its own read-only connection via read(). Repositories
+    use read() for queries and write() for mutations.
+    """
 
     def __init__(self, db_path: Path):
         """Initialize database connection."""
         self.db_path = db_path
         self._connection = None
+        self._write_lock = threading.Lock()
+        self._readers = threading.local()
 
     def get_connection(self) -> sqlite3.Connection:
         """Get database connection."""
         if self._connection is None:
-            self._connection = sqlite3.connect(str(self.db_path))
+            # cached_statements sizes sqlite3's prepared-statement
+            # LRU; above the number of distinct queries the
+            # repositories issue, hot calls skip re-parsing
+            self._connection = sqlite3.connect(
+                str(self.db_path),
+                cached_statements=256,
+                detect_types=sqlite3.PARSE_DECLTYPES,
+            )
             self._connection.row_factory = sqlite3.Row
+            # WAL commits append to a log instead of rewriting the
+            # journal (one fsync, readers don't block on writers), and
+            # the other PRAGMAs keep temp structures plus a 64MB page
+            # cache in memory and wait out short-lived locks; skipped
+            # for :memory: databases where journaling doesn't apply
+            if str(self.db_path) != ":memory:":
+                self._connection.executescript(
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                    "PRAGMA cache_size=-65536;"
+                    "PRAGMA busy_timeout=5000;"
+                    # Bound steady-state WAL growth under write-heavy
+                    # tallies (pages, not bytes; ~4MB at default page
+                    # size); maintenance() truncates during idle
+                    "PRAGMA wal_autocheckpoint=1000;"
+                )
+            self._connection.execute("PRAGMA foreign_keys=ON")
         return self._connection
 
+    def _get_reader(self) -> sqlite3.Connection:
+        """Get this thread's read-only connection, opening it lazily."""
+        reader = getattr(self._readers, "connection", None)
+        if reader is None:
+            try:
+                reader = sqlite3.connect(
+                    f"file:{self.db_path}?mode=ro",
+                    uri=True,
+                    cached_statements=256,
+                    detect_types=sqlite3.PARSE_DECLTYPES,
+                )
+            except sqlite3.OperationalError:
+                # e.g. :memory: databases or a file that doesn't exist
+                # yet; fall back to the shared write connection
+                return self.get_connection()
+            reader.row_factory = sqlite3.Row
+            reader.execute("PRAGMA busy_timeout=5000")
+            self._readers.connection = reader
+        return reader
+
+    @contextmanager
+    def read(self):
+        """Context manager yielding a read-only connection."""
+        yield self._get_reader()
+
+    @contextmanager
+    def write(self):
+        """Context manager yielding the write connection.
+
+        Commits on success and rolls back on error, with writes
+        serialized by a lock so concurrent tool calls don't interleave
+        on the shared connection.
+        """
+        with self._write_lock:
+            conn = self.get_connection()
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    def maintenance(self):
+        """Checkpoint and truncate the WAL during an idle moment.
+
+        wal_autocheckpoint bounds WAL growth, but the checkpoint it
+        triggers runs inside whichever commit crosses the threshold —
+        a latency spike on a user-facing write. Calling this after a
+        reminder batch moves that cost to idle time and truncates the
+        -wal file back to zero length.
+        """
+        with self._write_lock:
+            self.get_connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     def close(self):
         """Close database connection."""
         if self._connection:
             self._connection.close()
             self._connection = None
+        reader = getattr(self._readers, "connection", None)
+        if reader is not None:
+            reader.close()
+            self._readers.connection = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -112,3 +222,22 @@ class DatabaseConnection:
                 self._connection.commit()
             else:
                 self._connection.rollback()
+
+
+_connections: Dict[str, DatabaseConnection] = {}
+
+
+def get_database_connection(db_path: Path) -> DatabaseConnection:
+    """Get the shared DatabaseConnection for a database path.
+
+    The three campaign repositories used to open one connection each
+    to the same file — three page caches, three sets of PRAGMAs, and
+    writes from different repositories not serialized by a common
+    lock. Keying shared instances by path gives every repository on a
+    path one writer connection, one write lock, and one page cache.
+    """
+    key = str(db_path)
+    connection = _connections.get(key)
+    if connection is None:
+        connection = _connections[key] = DatabaseConnection(db_path)
+    return connection
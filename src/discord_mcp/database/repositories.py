@@ -1,211 +1,234 @@
 """Repository classes for campaign data access."""
 
+import functools
 import sqlite3
 import logging
 from datetime import datetime
 from typing import List, Optional
 from pathlib import Path
 
-from .models import Campaign, OptIn, ReminderLog, DatabaseConnection
+from .models import (
+    Campaign,
+    OptIn,
+    ReminderLog,
+    DatabaseConnection,
+    get_database_connection,
+)
 
 logger = logging.getLogger(__name__)
 
+# SQL hoisted to module constants for prepared-statement cache reuse
+# (rationale in server_registry.repositories.channel_repository) —
+# it matters most for queries polled in hot loops like
+# get_due_campaigns. RETURNING id hands the new rowid back in the INSERT itself instead
+# of a follow-up lastrowid C call (and stays correct if another write
+# lands on the shared connection in between)
+_SQL_INSERT_CAMPAIGN = """
+    INSERT INTO campaigns (title, channel_id, message_id, emoji, remind_at, remind_at_ts, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+_SQL_GET_CAMPAIGN = """
+    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
+    FROM campaigns WHERE id = ?
+"""
+_SQL_GET_CAMPAIGNS_BY_STATUS = """
+    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
+    FROM campaigns WHERE status = ?
+    ORDER BY remind_at ASC
+"""
+_SQL_GET_DUE_CAMPAIGNS = """
+    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
+    FROM campaigns
+    WHERE status = 'active' AND remind_at_ts <= ?
+    ORDER BY remind_at_ts ASC
+"""
+_SQL_UPDATE_CAMPAIGN_STATUS = "UPDATE campaigns SET status = ? WHERE id = ?"
+# OR IGNORE, not OR REPLACE: REPLACE deletes and reinserts the row on
+# conflict, churning both optins indexes and rewriting tallied_at;
+# IGNORE makes a duplicate reaction a near-noop
+_SQL_INSERT_OPTIN = """
+    INSERT OR IGNORE INTO optins (campaign_id, user_id, username, tallied_at)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_GET_OPTINS_AFTER = """
+    SELECT id, campaign_id, user_id, username, tallied_at
+    FROM optins
+    WHERE campaign_id = ? AND id > ?
+    ORDER BY id ASC
+    LIMIT ?
+"""
+_SQL_GET_OPTINS = """
+    SELECT id, campaign_id, user_id, username, tallied_at
+    FROM optins
+    WHERE campaign_id = ?
+    ORDER BY id ASC
+    LIMIT ?
+"""
+_SQL_ITER_OPTINS = """
+    SELECT id, campaign_id, user_id, username, tallied_at
+    FROM optins
+    WHERE campaign_id = ?
+    ORDER BY id ASC
+"""
+# Reads the trigger-maintained counter on campaigns instead of
+# walking the optins index with COUNT(*)
+_SQL_COUNT_OPTINS = "SELECT optin_count as count FROM campaigns WHERE id = ?"
+_SQL_CLEAR_OPTINS = "DELETE FROM optins WHERE campaign_id = ?"
+_SQL_INSERT_REMINDER_LOG = """
+    INSERT INTO reminders_log (campaign_id, sent_at, recipient_count, message_chunks, success, error_message)
+    VALUES (?, ?, ?, ?, ?, ?)
+    RETURNING id
+"""
+_SQL_GET_REMINDER_LOGS = """
+    SELECT id, campaign_id, sent_at, recipient_count, message_chunks, success, error_message
+    FROM reminders_log
+    WHERE campaign_id = ?
+    ORDER BY sent_at DESC
+"""
+
+
+def _db_op(default=None):
+    """Wrap a repository method with the shared failure handling.
+
+    Every method had the same ~10-line try/except tail — log the
+    error, return a type-appropriate fallback. Centralizing it trims
+    the bytecode per call and gives one place for lock handling: the
+    connection's busy_timeout already waits out most contention inside
+    SQLite, so the rare lock error that still escapes gets a single
+    retry before the method gives up and returns its default.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                try:
+                    return func(self, *args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    if "lock" not in str(e) and "busy" not in str(e):
+                        raise
+                    return func(self, *args, **kwargs)
+            except Exception as e:
+                logger.error(f"{func.__qualname__} failed: {e}")
+                return default
+
+        return wrapper
+
+    return decorator
+
+
+# Cursor-scoped row factories build each dataclass straight from the
+# result tuple — the SELECT lists above name columns in field order —
+# so fetch loops skip the per-row sqlite3.Row and dict intermediates
+# and become a plain fetchall()
+def _campaign_row(cursor, row):
+    return Campaign(*row)
+
+
+def _optin_row(cursor, row):
+    return OptIn(*row)
+
+
+def _reminder_log_row(cursor, row):
+    return ReminderLog(*row)
+
+
+def _resolve_connection(db_path) -> DatabaseConnection:
+    """Resolve a path (or an existing connection) to the shared
+    DatabaseConnection for that database, so all repositories on one
+    path share a single writer, write lock, and page cache."""
+    if isinstance(db_path, DatabaseConnection):
+        return db_path
+    return get_database_connection(db_path)
+
 
 class CampaignRepository:
     """Repository for campaign data operations."""
 
     def __init__(self, db_path: Path):
         """Initialize campaign repository."""
-        self.db_connection = DatabaseConnection(db_path)
+        self.db_connection = _resolve_connection(db_path)
 
+    @_db_op(default=None)
     def create_campaign(self, campaign: Campaign) -> Optional[int]:
         """Create a new campaign and return its ID."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    INSERT INTO campaigns (title, channel_id, message_id, emoji, remind_at, status)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        with self.db_connection.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                _SQL_INSERT_CAMPAIGN,
+                (
+                    campaign.title,
+                    campaign.channel_id,
+                    campaign.message_id,
+                    campaign.emoji,
+                    campaign.remind_at,
+                    # Integer epoch mirror of remind_at; the due
+                    # poll filters on this column
                     (
-                        campaign.title,
-                        campaign.channel_id,
-                        campaign.message_id,
-                        campaign.emoji,
-                        (
-                            campaign.remind_at.isoformat()
-                            if campaign.remind_at
-                            else None
-                        ),
-                        campaign.status,
+                        int(campaign.remind_at.timestamp())
+                        if campaign.remind_at
+                        else None
                     ),
-                )
-
-                campaign_id = cursor.lastrowid
-                logger.info(f"Created campaign with ID {campaign_id}")
-                return campaign_id
+                    campaign.status,
+                ),
+            )
 
-        except Exception as e:
-            logger.error(f"Failed to create campaign: {e}")
-            return None
+            campaign_id = cursor.fetchone()[0]
+            logger.info(f"Created campaign with ID {campaign_id}")
+            return campaign_id
 
+    @_db_op(default=None)
     def get_campaign(self, campaign_id: int) -> Optional[Campaign]:
         """Get campaign by ID."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
-                    FROM campaigns WHERE id = ?
-                """,
-                    (campaign_id,),
-                )
-
-                row = cursor.fetchone()
-                if row:
-                    return Campaign(
-                        id=row["id"],
-                        title=row["title"],
-                        channel_id=row["channel_id"],
-                        message_id=row["message_id"],
-                        emoji=row["emoji"],
-                        remind_at=(
-                            datetime.fromisoformat(row["remind_at"])
-                            if row["remind_at"]
-                            else None
-                        ),
-                        created_at=(
-                            datetime.fromisoformat(row["created_at"])
-                            if row["created_at"]
-                            else None
-                        ),
-                        status=row["status"],
-                    )
-                return None
-
-        except Exception as e:
-            logger.error(f"Failed to get campaign {campaign_id}: {e}")
-            return None
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.row_factory = _campaign_row
+            cursor.execute(_SQL_GET_CAMPAIGN, (campaign_id,))
 
+            return cursor.fetchone()
+
+    @_db_op(default=[])
     def get_campaigns_by_status(self, status: str = "active") -> List[Campaign]:
         """Get campaigns by status."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
-                    FROM campaigns WHERE status = ?
-                    ORDER BY remind_at ASC
-                """,
-                    (status,),
-                )
-
-                campaigns = []
-                for row in cursor.fetchall():
-                    campaigns.append(
-                        Campaign(
-                            id=row["id"],
-                            title=row["title"],
-                            channel_id=row["channel_id"],
-                            message_id=row["message_id"],
-                            emoji=row["emoji"],
-                            remind_at=(
-                                datetime.fromisoformat(row["remind_at"])
-                                if row["remind_at"]
-                                else None
-                            ),
-                            created_at=(
-                                datetime.fromisoformat(row["created_at"])
-                                if row["created_at"]
-                                else None
-                            ),
-                            status=row["status"],
-                        )
-                    )
-
-                return campaigns
-
-        except Exception as e:
-            logger.error(f"Failed to get campaigns by status {status}: {e}")
-            return []
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.row_factory = _campaign_row
+            cursor.execute(_SQL_GET_CAMPAIGNS_BY_STATUS, (status,))
 
+            return cursor.fetchall()
+
+    @_db_op(default=[])
     def get_due_campaigns(self, now: datetime = None) -> List[Campaign]:
         """Get campaigns that are due for reminders."""
         if now is None:
             now = datetime.now()
 
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, title, channel_id, message_id, emoji, remind_at, created_at, status
-                    FROM campaigns
-                    WHERE status = 'active' AND remind_at <= ?
-                    ORDER BY remind_at ASC
-                """,
-                    (now.isoformat(),),
-                )
-
-                campaigns = []
-                for row in cursor.fetchall():
-                    campaigns.append(
-                        Campaign(
-                            id=row["id"],
-                            title=row["title"],
-                            channel_id=row["channel_id"],
-                            message_id=row["message_id"],
-                            emoji=row["emoji"],
-                            remind_at=(
-                                datetime.fromisoformat(row["remind_at"])
-                                if row["remind_at"]
-                                else None
-                            ),
-                            created_at=(
-                                datetime.fromisoformat(row["created_at"])
-                                if row["created_at"]
-                                else None
-                            ),
-                            status=row["status"],
-                        )
-                    )
-
-                return campaigns
-
-        except Exception as e:
-            logger.error(f"Failed to get due campaigns: {e}")
-            return []
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.row_factory = _campaign_row
+            cursor.execute(_SQL_GET_DUE_CAMPAIGNS, (int(now.timestamp()),))
+
+            return cursor.fetchall()
 
+    @_db_op(default=False)
     def update_campaign_status(self, campaign_id: int, status: str) -> bool:
         """Update campaign status."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
+        with self.db_connection.write() as conn:
+            cursor = conn.cursor()
 
-                cursor.execute(
-                    """
-                    UPDATE campaigns SET status = ? WHERE id = ?
-                """,
-                    (status, campaign_id),
-                )
+            cursor.execute(_SQL_UPDATE_CAMPAIGN_STATUS, (status, campaign_id))
 
-                if cursor.rowcount > 0:
-                    logger.info(f"Updated campaign {campaign_id} status to {status}")
-                    return True
-                else:
-                    logger.warning(f"No campaign found with ID {campaign_id}")
-                    return False
-
-        except Exception as e:
-            logger.error(f"Failed to update campaign {campaign_id} status: {e}")
-            return False
+            if cursor.rowcount > 0:
+                logger.info(f"Updated campaign {campaign_id} status to {status}")
+                return True
+            else:
+                logger.warning(f"No campaign found with ID {campaign_id}")
+                return False
 
 
 class OptInRepository:
@@ -213,134 +236,102 @@ class OptInRepository:
 
     def __init__(self, db_path: Path):
         """Initialize opt-in repository."""
-        self.db_connection = DatabaseConnection(db_path)
+        self.db_connection = _resolve_connection(db_path)
 
     def add_optin(self, optin: OptIn) -> bool:
         """Add an opt-in (idempotent - won't duplicate)."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO optins (campaign_id, user_id, username, tallied_at)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        optin.campaign_id,
-                        optin.user_id,
-                        optin.username,
-                        (
-                            optin.tallied_at.isoformat()
-                            if optin.tallied_at
-                            else datetime.now().isoformat()
-                        ),
-                    ),
-                )
+        return self.add_optins([optin]) == 1
 
-                logger.debug(
-                    f"Added opt-in for user {optin.user_id} in campaign {optin.campaign_id}"
-                )
-                return True
+    @_db_op(default=0)
+    def add_optins(self, optins: List[OptIn]) -> int:
+        """Add many opt-ins in one transaction (idempotent).
+
+        One executemany under a single commit means one fsync for the
+        whole batch instead of one per reactor.
+        """
+        if not optins:
+            return 0
 
-        except Exception as e:
-            logger.error(f"Failed to add opt-in: {e}")
-            return False
+        # The registered datetime adapter converts these binds in the
+        # sqlite3 layer; no per-row isoformat() here
+        now = datetime.now()
+        rows = [
+            (
+                optin.campaign_id,
+                optin.user_id,
+                optin.username,
+                optin.tallied_at or now,
+            )
+            for optin in optins
+        ]
 
+        with self.db_connection.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.executemany(_SQL_INSERT_OPTIN, rows)
+
+            logger.debug(f"Added {len(rows)} opt-ins in one batch")
+            return len(rows)
+
+    @_db_op(default=[])
     def get_optins(
-        self, campaign_id: int, limit: int = 100, after_user_id: str = None
+        self, campaign_id: int, limit: int = 100, after_id: int = None
     ) -> List[OptIn]:
-        """Get opt-ins for a campaign with pagination."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                if after_user_id:
-                    cursor.execute(
-                        """
-                        SELECT id, campaign_id, user_id, username, tallied_at
-                        FROM optins
-                        WHERE campaign_id = ? AND user_id > ?
-                        ORDER BY user_id ASC
-                        LIMIT ?
-                    """,
-                        (campaign_id, after_user_id, limit),
-                    )
-                else:
-                    cursor.execute(
-                        """
-                        SELECT id, campaign_id, user_id, username, tallied_at
-                        FROM optins
-                        WHERE campaign_id = ?
-                        ORDER BY user_id ASC
-                        LIMIT ?
-                    """,
-                        (campaign_id, limit),
-                    )
-
-                optins = []
-                for row in cursor.fetchall():
-                    optins.append(
-                        OptIn(
-                            id=row["id"],
-                            campaign_id=row["campaign_id"],
-                            user_id=row["user_id"],
-                            username=row["username"],
-                            tallied_at=(
-                                datetime.fromisoformat(row["tallied_at"])
-                                if row["tallied_at"]
-                                else None
-                            ),
-                        )
-                    )
-
-                return optins
-
-        except Exception as e:
-            logger.error(f"Failed to get opt-ins for campaign {campaign_id}: {e}")
-            return []
+        """Get opt-ins for a campaign with keyset pagination.
+
+        Pages seek by rowid — integer B-tree compares on the
+        (campaign_id, id) index instead of user_id text collation.
+        Callers pass the id of the last opt-in from the previous page.
+        """
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
 
+            cursor.row_factory = _optin_row
+            if after_id:
+                cursor.execute(_SQL_GET_OPTINS_AFTER, (campaign_id, after_id, limit))
+            else:
+                cursor.execute(_SQL_GET_OPTINS, (campaign_id, limit))
+
+            return cursor.fetchall()
+
+    def iter_optins(self, campaign_id: int, batch_size: int = 1000):
+        """Yield opt-ins for a campaign without materializing them all.
+
+        fetchall() doubles peak memory for big campaigns — SQLite's
+        buffer plus a full Python list. Streaming in fetchmany batches
+        keeps residency at one batch regardless of campaign size;
+        callers that need a bounded page still use get_optins.
+        """
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.row_factory = _optin_row
+            cursor.execute(_SQL_ITER_OPTINS, (campaign_id,))
+
+            while rows := cursor.fetchmany(batch_size):
+                yield from rows
+
+    @_db_op(default=0)
     def get_optin_count(self, campaign_id: int) -> int:
         """Get total count of opt-ins for a campaign."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT COUNT(*) as count FROM optins WHERE campaign_id = ?
-                """,
-                    (campaign_id,),
-                )
-
-                row = cursor.fetchone()
-                return row["count"] if row else 0
-
-        except Exception as e:
-            logger.error(f"Failed to get opt-in count for campaign {campaign_id}: {e}")
-            return 0
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(_SQL_COUNT_OPTINS, (campaign_id,))
+
+            row = cursor.fetchone()
+            return row["count"] if row else 0
 
+    @_db_op(default=False)
     def clear_optins(self, campaign_id: int) -> bool:
         """Clear all opt-ins for a campaign (for re-tallying)."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    DELETE FROM optins WHERE campaign_id = ?
-                """,
-                    (campaign_id,),
-                )
-
-                logger.info(
-                    f"Cleared {cursor.rowcount} opt-ins for campaign {campaign_id}"
-                )
-                return True
+        with self.db_connection.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(_SQL_CLEAR_OPTINS, (campaign_id,))
 
-        except Exception as e:
-            logger.error(f"Failed to clear opt-ins for campaign {campaign_id}: {e}")
-            return False
+            logger.info(f"Cleared {cursor.rowcount} opt-ins for campaign {campaign_id}")
+            return True
 
 
 class ReminderLogRepository:
@@ -348,77 +339,37 @@ class ReminderLogRepository:
 
     def __init__(self, db_path: Path):
         """Initialize reminder log repository."""
-        self.db_connection = DatabaseConnection(db_path)
+        self.db_connection = _resolve_connection(db_path)
 
+    @_db_op(default=None)
     def log_reminder(self, log_entry: ReminderLog) -> Optional[int]:
         """Log a reminder attempt."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    INSERT INTO reminders_log (campaign_id, sent_at, recipient_count, message_chunks, success, error_message)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        log_entry.campaign_id,
-                        (
-                            log_entry.sent_at.isoformat()
-                            if log_entry.sent_at
-                            else datetime.now().isoformat()
-                        ),
-                        log_entry.recipient_count,
-                        log_entry.message_chunks,
-                        log_entry.success,
-                        log_entry.error_message,
-                    ),
-                )
-
-                log_id = cursor.lastrowid
-                logger.info(f"Logged reminder attempt with ID {log_id}")
-                return log_id
-
-        except Exception as e:
-            logger.error(f"Failed to log reminder: {e}")
-            return None
-
+        with self.db_connection.write() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute(
+                _SQL_INSERT_REMINDER_LOG,
+                (
+                    log_entry.campaign_id,
+                    log_entry.sent_at or datetime.now(),
+                    log_entry.recipient_count,
+                    log_entry.message_chunks,
+                    log_entry.success,
+                    log_entry.error_message,
+                ),
+            )
+
+            log_id = cursor.fetchone()[0]
+            logger.info(f"Logged reminder attempt with ID {log_id}")
+            return log_id
+
+    @_db_op(default=[])
     def get_reminder_logs(self, campaign_id: int) -> List[ReminderLog]:
         """Get reminder logs for a campaign."""
-        try:
-            with self.db_connection as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    SELECT id, campaign_id, sent_at, recipient_count, message_chunks, success, error_message
-                    FROM reminders_log
-                    WHERE campaign_id = ?
-                    ORDER BY sent_at DESC
-                """,
-                    (campaign_id,),
-                )
-
-                logs = []
-                for row in cursor.fetchall():
-                    logs.append(
-                        ReminderLog(
-                            id=row["id"],
-                            campaign_id=row["campaign_id"],
-                            sent_at=(
-                                datetime.fromisoformat(row["sent_at"])
-                                if row["sent_at"]
-                                else None
-                            ),
-                            recipient_count=row["recipient_count"],
-                            message_chunks=row["message_chunks"],
-                            success=bool(row["success"]),
-                            error_message=row["error_message"],
-                        )
-                    )
-
-                return logs
-
-        except Exception as e:
-            logger.error(f"Failed to get reminder logs for campaign {campaign_id}: {e}")
-            return []
+        with self.db_connection.read() as conn:
+            cursor = conn.cursor()
+
+            cursor.row_factory = _reminder_log_row
+            cursor.execute(_SQL_GET_REMINDER_LOGS, (campaign_id,))
+
+            return cursor.fetchall()
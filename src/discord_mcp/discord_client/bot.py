@@ -3,8 +3,11 @@ Simple Discord bot implementation that can be connected to the MCP server.
 """
 
 import os
+import time
 import asyncio
 import logging
+from collections import OrderedDict
+
 import discord
 from discord.ext import commands
 
@@ -15,6 +18,99 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Channel info cache settings
+CHANNEL_INFO_CACHE_TTL = 60.0  # seconds
+CHANNEL_INFO_CACHE_MAX_SIZE = 1024
+
+# Resolved channel-object cache settings
+CHANNEL_OBJ_CACHE_MAX_SIZE = 256
+
+# Bound on the fetch_channel REST fallback so a stalled API call
+# can't hang callers indefinitely
+FETCH_CHANNEL_TIMEOUT = 5.0  # seconds
+
+# Outgoing message rate limits (kept under Discord's per-route limits)
+SEND_MAX_CONCURRENCY = 5
+SEND_RATE_LIMIT = 30  # messages
+SEND_RATE_PERIOD = 60.0  # seconds
+
+
+class TokenBucket:
+    """Simple async token bucket for client-side rate limiting."""
+
+    def __init__(self, rate: int, per: float):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._updated) * (self.rate / self.per),
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * (self.per / self.rate))
+
+
+def _text_channel_info(channel):
+    """Serialize a text-like channel using direct attribute access."""
+    return {
+        "id": str(channel.id),
+        "name": channel.name,
+        "type": str(channel.type),
+        "topic": channel.topic,
+        "nsfw": channel.nsfw,
+        "position": channel.position,
+        "created_at": channel.created_at.isoformat(),
+    }
+
+
+def _voice_channel_info(channel):
+    """Serialize a voice-like channel; no topic, but bitrate/user limit."""
+    return {
+        "id": str(channel.id),
+        "name": channel.name,
+        "type": str(channel.type),
+        "topic": None,
+        "nsfw": channel.nsfw,
+        "position": channel.position,
+        "bitrate": channel.bitrate,
+        "user_limit": channel.user_limit,
+        "created_at": channel.created_at.isoformat(),
+    }
+
+
+def _generic_channel_info(channel):
+    """Fallback serializer for channel types without a typed entry."""
+    return {
+        "id": str(channel.id),
+        "name": channel.name,
+        "type": str(channel.type),
+        "topic": getattr(channel, "topic", None),
+        "nsfw": getattr(channel, "nsfw", False),
+        "position": getattr(channel, "position", 0),
+        "created_at": channel.created_at.isoformat(),
+    }
+
+
+# Per-type serializers so the common channel types skip the getattr
+# probing in _generic_channel_info
+_CHANNEL_SERIALIZERS = {
+    discord.ChannelType.text: _text_channel_info,
+    discord.ChannelType.news: _text_channel_info,
+    discord.ChannelType.voice: _voice_channel_info,
+    discord.ChannelType.stage_voice: _voice_channel_info,
+}
+
 
 class DiscordMCPBot(commands.Bot):
     """Discord bot that can be connected to an MCP server."""
@@ -28,21 +124,84 @@ class DiscordMCPBot(commands.Bot):
 
         self.config = config
 
-        # Set up intents
-        intents = discord.Intents.default()
+        # Signaled from on_ready so callers can await readiness instead
+        # of polling bot.user
+        self.ready_event = asyncio.Event()
+
+        # str(self.user) computed once on ready; status calls read this
+        # instead of re-formatting the user per call
+        self._display_name = None
+
+        # TTL + LRU cache for channel metadata, keyed by channel id.
+        # Entries are (monotonic timestamp, info dict) pairs.
+        self._channel_info_cache: OrderedDict[int, tuple[float, dict]] = OrderedDict()
+
+        # LRU of resolved channel objects so consecutive calls for the
+        # same channel skip the get_channel/fetch_channel resolve path
+        self._channel_obj_cache: OrderedDict[int, discord.abc.Messageable] = (
+            OrderedDict()
+        )
+
+        # Pre-built immutable AllowedMentions configs so sends don't
+        # allocate a new one per message
+        self._allowed_mentions = {
+            False: discord.AllowedMentions(everyone=False),
+            True: discord.AllowedMentions(everyone=True),
+        }
+
+        # Proactive send throttling so bursty senders don't trip
+        # Discord's 429 backoff and stall the whole connection
+        self._send_sem = asyncio.Semaphore(SEND_MAX_CONCURRENCY)
+        self._send_bucket = TokenBucket(rate=SEND_RATE_LIMIT, per=SEND_RATE_PERIOD)
+
+        # Only the intents the MCP tools actually consume: guild/channel
+        # state, guild messages for the command prefix, and message
+        # content. Leaving typing/presence/voice disabled keeps the
+        # gateway from streaming events we would only pay to discard.
+        intents = discord.Intents.none()
+        intents.guilds = True
+        intents.guild_messages = True
         intents.message_content = True
-        intents.members = True
 
-        # Initialize the bot
-        super().__init__(command_prefix="!", intents=intents, help_command=None)
+        # Initialize the bot. Member chunking and the member cache stay
+        # off: no tool reads members, and chunking every guild at
+        # startup costs a gateway request burst plus tens of MB of
+        # cache on large guilds.
+        super().__init__(
+            command_prefix="!",
+            intents=intents,
+            help_command=None,
+            chunk_guilds_at_startup=False,
+            member_cache_flags=discord.MemberCacheFlags.none(),
+        )
+
+    async def _resolve_channel(self, cid: int):
+        """Resolve a channel id to a channel object, via a small LRU."""
+        channel = self._channel_obj_cache.get(cid)
+        if channel is not None:
+            self._channel_obj_cache.move_to_end(cid)
+            return channel
+
+        channel = self.get_channel(cid)
+        if not channel:
+            channel = await asyncio.wait_for(
+                self.fetch_channel(cid), timeout=FETCH_CHANNEL_TIMEOUT
+            )
+
+        self._channel_obj_cache[cid] = channel
+        while len(self._channel_obj_cache) > CHANNEL_OBJ_CACHE_MAX_SIZE:
+            self._channel_obj_cache.popitem(last=False)
+        return channel
 
     async def send_direct_message(self, channel_id, message, mention_everyone=False):
         """Send a message directly to a channel."""
-        logger.info(f"Sending direct message to channel {channel_id}: {message}")
+        # Lazy %s formatting: the message body is only rendered when
+        # DEBUG logging is actually enabled
+        logger.debug("Sending direct message to channel %s: %s", channel_id, message)
 
         # Check dry run mode
         if self.config.dry_run:
-            logger.info("DRY_RUN mode: Message not actually sent")
+            logger.debug("DRY_RUN mode: Message not actually sent")
             return {
                 "success": True,
                 "channel_id": channel_id,
@@ -54,9 +213,8 @@ class DiscordMCPBot(commands.Bot):
 
         try:
             # Get the channel
-            channel = self.get_channel(int(channel_id))
-            if not channel:
-                channel = await self.fetch_channel(int(channel_id))
+            cid = int(channel_id)
+            channel = await self._resolve_channel(cid)
 
             # Check guild allowlist if configured
             if channel.guild and not self.config.is_guild_allowed(
@@ -67,11 +225,13 @@ class DiscordMCPBot(commands.Bot):
                     "error": f"Guild {channel.guild.id} is not in the allowlist",
                 }
 
-            # Send the message
-            allowed_mentions = discord.AllowedMentions(everyone=mention_everyone)
-            sent_message = await channel.send(
-                content=message, allowed_mentions=allowed_mentions
-            )
+            # Send the message, throttled client-side
+            allowed_mentions = self._allowed_mentions[bool(mention_everyone)]
+            async with self._send_sem:
+                await self._send_bucket.acquire()
+                sent_message = await channel.send(
+                    content=message, allowed_mentions=allowed_mentions
+                )
 
             logger.info(f"Message sent successfully: {sent_message.id}")
             return {
@@ -81,17 +241,20 @@ class DiscordMCPBot(commands.Bot):
                 "message_id": str(sent_message.id),
                 "timestamp": sent_message.created_at.isoformat(),
             }
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out fetching channel {channel_id}")
+            return {"success": False, "error": "Discord API timeout"}
         except Exception as e:
             logger.error(f"Error sending message: {e}")
             return {"success": False, "error": str(e)}
 
     async def get_channel_info(self, channel_id):
         """Get information about a channel directly."""
-        logger.info(f"Getting channel info for channel {channel_id}")
+        logger.debug("Getting channel info for channel %s", channel_id)
 
         # Check dry run mode
         if self.config.dry_run:
-            logger.info("DRY_RUN mode: Returning mock channel info")
+            logger.debug("DRY_RUN mode: Returning mock channel info")
             return {
                 "success": True,
                 "id": channel_id,
@@ -105,10 +268,17 @@ class DiscordMCPBot(commands.Bot):
             }
 
         try:
+            cid = int(channel_id)
+
+            # Serve from the TTL cache if the entry is still fresh
+            now = time.monotonic()
+            entry = self._channel_info_cache.get(cid)
+            if entry is not None and now - entry[0] < CHANNEL_INFO_CACHE_TTL:
+                self._channel_info_cache.move_to_end(cid)
+                return entry[1]
+
             # Get the channel
-            channel = self.get_channel(int(channel_id))
-            if not channel:
-                channel = await self.fetch_channel(int(channel_id))
+            channel = await self._resolve_channel(cid)
 
             # Check guild allowlist if configured
             if channel.guild and not self.config.is_guild_allowed(
@@ -119,21 +289,33 @@ class DiscordMCPBot(commands.Bot):
                     "error": f"Guild {channel.guild.id} is not in the allowlist",
                 }
 
-            # Return channel info
-            return {
-                "success": True,
-                "id": str(channel.id),
-                "name": channel.name,
-                "type": str(channel.type),
-                "topic": getattr(channel, "topic", None),
-                "nsfw": getattr(channel, "nsfw", False),
-                "position": getattr(channel, "position", 0),
-                "created_at": channel.created_at.isoformat(),
-            }
+            # Build channel info and cache it, evicting the oldest entry
+            # if the cache has grown past its bound
+            serialize = _CHANNEL_SERIALIZERS.get(channel.type, _generic_channel_info)
+            result = {"success": True, **serialize(channel)}
+            self._channel_info_cache[cid] = (now, result)
+            self._channel_info_cache.move_to_end(cid)
+            while len(self._channel_info_cache) > CHANNEL_INFO_CACHE_MAX_SIZE:
+                self._channel_info_cache.popitem(last=False)
+
+            return result
+        except asyncio.TimeoutError:
+            logger.error(f"Timed out fetching channel {channel_id}")
+            return {"success": False, "error": "Discord API timeout"}
         except Exception as e:
             logger.error(f"Error getting channel info: {e}")
             return {"success": False, "error": str(e)}
 
+    async def on_guild_channel_update(self, before, after):
+        """Invalidate cached channel state when a channel changes."""
+        self._channel_info_cache.pop(after.id, None)
+        self._channel_obj_cache.pop(after.id, None)
+
+    async def on_guild_channel_delete(self, channel):
+        """Invalidate cached channel state when a channel is deleted."""
+        self._channel_info_cache.pop(channel.id, None)
+        self._channel_obj_cache.pop(channel.id, None)
+
     async def setup_hook(self):
         """Set up the bot when it's starting."""
         logger.info("Setting up Discord bot...")
@@ -145,6 +327,9 @@ class DiscordMCPBot(commands.Bot):
 
     async def on_ready(self):
         """Called when the bot is ready."""
+        self._display_name = str(self.user)
+        self.ready_event.set()
+
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
         logger.info(f"Connected to {len(self.guilds)} guilds")
 
@@ -193,12 +378,11 @@ class BasicCommands(commands.Cog):
 
 
 async def run_bot():
-    """Run the Discord bot."""
-    # Load environment variables from .env file
-    from dotenv import load_dotenv
-
-    load_dotenv()
+    """Run the Discord bot.
 
+    Callers are expected to have loaded environment variables already
+    (the CLI does this at import); standalone runs load .env below.
+    """
     # Get the token from environment variable
     token = os.environ.get("DISCORD_TOKEN")
     if not token:
@@ -214,5 +398,8 @@ async def run_bot():
 
 
 if __name__ == "__main__":
-    # Run the bot
+    # Load environment variables for standalone runs, then run the bot
+    from dotenv import load_dotenv
+
+    load_dotenv()
     asyncio.run(run_bot())
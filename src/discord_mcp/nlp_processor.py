@@ -5,27 +5,155 @@ While the MCP client (LLM) handles intent detection, the server still needs to r
 entity references like "general channel" to actual Discord IDs.
 """
 
+import asyncio
+import json
 import logging
+import os
+import time
+from collections import OrderedDict
 from typing import Optional
 from .server_registry.api import ServerRegistryAPI
 
 logger = logging.getLogger(__name__)
 
+# Bound on cached resolutions; LLM tool calls re-resolve a small set
+# of references ("general", "announcements", ...) over and over
+_CACHE_MAX_SIZE = 4096
+# Resolved ids go stale when servers rename things; a day bounds that
+_CACHE_TTL_SECONDS = 24 * 60 * 60
+# Sidecar writes are debounced so a burst of resolutions pays for at
+# most one dump per interval
+_FLUSH_INTERVAL_SECONDS = 30
+
+
+class _ResolveCache:
+    """LRU of resolved Discord ids backed by a JSON sidecar file.
+
+    Lookups hit an in-memory OrderedDict keyed by
+    (kind, reference, server_id). The sidecar persists entries across
+    restarts — a fresh process resolves warm instead of re-walking the
+    registry — and doubles as a fallback map: when the registry
+    lookup itself fails, the last persisted id is still served, TTL
+    notwithstanding. Entries past the TTL are otherwise ignored.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._entries: OrderedDict = OrderedDict()
+        self._dirty = False
+        self._last_flush = 0.0
+        self._load()
+
+    @staticmethod
+    def _key(kind: str, reference: str, server_id: Optional[str]) -> tuple:
+        return (kind, reference.lower(), server_id or "")
+
+    def _load(self) -> None:
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                raw = json.load(f)
+            # Inside the try: valid JSON of the wrong shape (a list,
+            # entries missing "id"/"ts", ...) is just as unreadable as
+            # a parse error and must not break construction
+            for kind, refs in raw.items():
+                for scoped_ref, entry in refs.items():
+                    server_id, _, reference = scoped_ref.partition("\x1f")
+                    self._entries[(kind, reference, server_id)] = (
+                        entry["id"],
+                        entry["ts"],
+                    )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            self._entries.clear()
+            logger.warning(f"Ignoring unreadable id cache {self._path}: {e}")
+
+    def get(
+        self,
+        kind: str,
+        reference: str,
+        server_id: Optional[str] = None,
+        allow_stale: bool = False,
+    ) -> Optional[str]:
+        """Return the cached id, or None on miss/expiry.
+
+        allow_stale serves entries past the TTL — the fallback path
+        for when the registry itself is erroring.
+        """
+        key = self._key(kind, reference, server_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        discord_id, ts = entry
+        if not allow_stale and time.time() - ts > _CACHE_TTL_SECONDS:
+            return None
+        self._entries.move_to_end(key)
+        return discord_id
+
+    def put(
+        self, kind: str, reference: str, server_id: Optional[str], discord_id: str
+    ) -> None:
+        """Record a successful resolution, evicting oldest-first."""
+        key = self._key(kind, reference, server_id)
+        self._entries[key] = (discord_id, time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > _CACHE_MAX_SIZE:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def _dump(self) -> None:
+        raw: dict = {}
+        for (kind, reference, server_id), (discord_id, ts) in self._entries.items():
+            raw.setdefault(kind, {})[f"{server_id}\x1f{reference}"] = {
+                "id": discord_id,
+                "ts": ts,
+            }
+        try:
+            os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+            with open(self._path, "w", encoding="utf-8") as f:
+                json.dump(raw, f)
+        except OSError as e:
+            logger.warning(f"Could not write id cache {self._path}: {e}")
+
+    async def flush(self) -> None:
+        """Write the sidecar if dirty, at most once per interval.
+
+        The dump runs in a worker thread so the event loop isn't
+        blocked on file I/O.
+        """
+        now = time.time()
+        if not self._dirty or now - self._last_flush < _FLUSH_INTERVAL_SECONDS:
+            return
+        self._dirty = False
+        self._last_flush = now
+        await asyncio.to_thread(self._dump)
+
+
+def _default_cache_path() -> str:
+    return os.path.join(
+        os.path.expanduser("~"), ".mcp_discord", "discord_id_cache.json"
+    )
+
 
 class EntityResolver:
     """Resolves entity references to Discord IDs.
 
     This class provides a simplified interface for resolving entity references
-    to Discord IDs using the ServerRegistryAPI.
+    to Discord IDs using the ServerRegistryAPI. Successful resolutions are
+    cached in memory and persisted to a JSON sidecar, so repeated tool calls
+    re-resolving the same reference are a dict get instead of a registry
+    round trip, and restarts start warm.
     """
 
-    def __init__(self, registry_api: ServerRegistryAPI):
+    def __init__(self, registry_api: ServerRegistryAPI, cache_path: str = None):
         """Initialize with a server registry API.
 
         Args:
             registry_api: The server registry API to use for entity resolution
+            cache_path: Optional path for the persistent id cache
         """
         self.registry = registry_api
+        self._cache = _ResolveCache(cache_path or _default_cache_path())
 
     async def resolve_server(self, server_reference: str) -> str:
         """Resolve a server reference to a server ID.
@@ -36,18 +164,27 @@ class EntityResolver:
         Returns:
             Server ID if found, otherwise the original reference
         """
+        cached = self._cache.get("server", server_reference)
+        if cached:
+            return cached
         try:
             server = self.registry.get_server(server_reference)
             if server and server.discord_id:
                 logger.debug(
                     f"Resolved server '{server_reference}' to ID '{server.discord_id}'"
                 )
+                self._cache.put("server", server_reference, None, server.discord_id)
+                await self._cache.flush()
                 return server.discord_id
             logger.debug(f"Could not resolve server '{server_reference}'")
             return server_reference
         except Exception as e:
             logger.error(f"Error resolving server '{server_reference}': {e}")
-            return server_reference
+            # Fall back to the last persisted resolution, stale or not
+            return (
+                self._cache.get("server", server_reference, allow_stale=True)
+                or server_reference
+            )
 
     async def resolve_channel(
         self, channel_reference: str, server_id: Optional[str] = None
@@ -61,18 +198,30 @@ class EntityResolver:
         Returns:
             Channel ID if found, otherwise the original reference
         """
+        cached = self._cache.get("channel", channel_reference, server_id)
+        if cached:
+            return cached
         try:
             channel = self.registry.get_channel(channel_reference, server_id)
             if channel and channel.discord_id:
                 logger.debug(
                     f"Resolved channel '{channel_reference}' to ID '{channel.discord_id}'"
                 )
+                self._cache.put(
+                    "channel", channel_reference, server_id, channel.discord_id
+                )
+                await self._cache.flush()
                 return channel.discord_id
             logger.debug(f"Could not resolve channel '{channel_reference}'")
             return channel_reference
         except Exception as e:
             logger.error(f"Error resolving channel '{channel_reference}': {e}")
-            return channel_reference
+            return (
+                self._cache.get(
+                    "channel", channel_reference, server_id, allow_stale=True
+                )
+                or channel_reference
+            )
 
     async def resolve_role(
         self, role_reference: str, server_id: Optional[str] = None
@@ -86,15 +235,23 @@ class EntityResolver:
         Returns:
             Role ID if found, otherwise the original reference
         """
+        cached = self._cache.get("role", role_reference, server_id)
+        if cached:
+            return cached
         try:
             role = self.registry.get_role(role_reference, server_id)
             if role and role.discord_id:
                 logger.debug(
                     f"Resolved role '{role_reference}' to ID '{role.discord_id}'"
                 )
+                self._cache.put("role", role_reference, server_id, role.discord_id)
+                await self._cache.flush()
                 return role.discord_id
             logger.debug(f"Could not resolve role '{role_reference}'")
             return role_reference
         except Exception as e:
             logger.error(f"Error resolving role '{role_reference}': {e}")
-            return role_reference
+            return (
+                self._cache.get("role", role_reference, server_id, allow_stale=True)
+                or role_reference
+            )
@@ -3,11 +3,14 @@
 import asyncio
 import logging
 import os
+import sys
 from functools import wraps
 
 from mcp.server.fastmcp import FastMCP
 
 from .config import Config
+from .discord_client.bot import DiscordMCPBot
+from .state import bot_state
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -20,10 +23,25 @@ def setup_logging(level: str = "INFO") -> None:
 
 
 # Global variables
+# discord_bot/bot_task mirror bot_state for external readers (tests,
+# tools) that look the bot up as a module attribute; bot_state is the
+# source of truth for lifecycle bookkeeping
 discord_bot = None
 bot_task = None
 registry = None
 
+# Environment variables are read once at import; refresh_env() re-reads
+# them if the process environment changes later
+_DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "")
+
+
+def refresh_env() -> str:
+    """Re-read cached environment variables; returns the Discord token."""
+    global _DISCORD_TOKEN
+    _DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "")
+    return _DISCORD_TOKEN
+
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -103,14 +121,41 @@ async def config_info():
     }
 
 
+# Set once the bot has connected; the hot path in require_discord_bot
+# collapses to a single Event.is_set() instead of re-probing bot state
+_bot_ready = bot_state.ready
+
+
+def tool_errors(action: str):
+    """Wrap a tool so failures are logged with a traceback and returned
+    as the standard ``{"error": ...}`` payload, instead of each tool
+    carrying its own try/except copy."""
+
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception as e:
+                logger.exception("Error %s", action)
+                return {"error": f"Error {action}: {str(e)}"}
+
+        return wrapper
+
+    return decorator
+
+
 # Helper function to ensure Discord bot is ready
 def require_discord_bot(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
         global discord_bot
+        if _bot_ready.is_set():
+            return await func(*args, **kwargs)
+
         if not discord_bot or discord_bot.is_closed() or not discord_bot.user:
             # Try to start the bot if it's not running
-            token = kwargs.get("token", "") or os.getenv("DISCORD_TOKEN", "")
+            token = kwargs.get("token", "") or _DISCORD_TOKEN or refresh_env()
             if not token:
                 return {
                     "error": "Discord token not provided and DISCORD_TOKEN environment variable not set"
@@ -140,44 +185,69 @@ async def ensure_bot_running(token: str = "") -> dict:
     # Check if bot is already running and connected
     if discord_bot and not discord_bot.is_closed() and discord_bot.user:
         logger.info(f"Bot is already running as {discord_bot.user}")
+        _bot_ready.set()
+        return {
+            "success": True,
+            "message": "Bot is already running",
+            "bot_user": discord_bot._display_name or str(discord_bot.user),
+            "guild_count": (len(discord_bot.guilds) if discord_bot.guilds else 0),
+        }
+
+    # Bot instance exists but hasn't finished logging in: wait for its
+    # ready event instead of spawning a duplicate instance or polling
+    if discord_bot and not discord_bot.is_closed():
+        try:
+            await asyncio.wait_for(discord_bot.wait_until_ready(), timeout=5)
+        except asyncio.TimeoutError:
+            return {"error": "Bot is not logged in yet"}
+        _bot_ready.set()
         return {
             "success": True,
             "message": "Bot is already running",
-            "bot_user": str(discord_bot.user),
+            "bot_user": discord_bot._display_name or str(discord_bot.user),
             "guild_count": (len(discord_bot.guilds) if discord_bot.guilds else 0),
         }
 
     try:
-        # Import the bot class
-        from .discord_client.bot import DiscordMCPBot
-
-        # Create new bot instance
-        discord_bot = DiscordMCPBot(config)
-
-        # Start the bot in a background task
-        bot_task = asyncio.create_task(discord_bot.start(token))
-
-        # Wait for the bot to connect and guilds to load
-        max_wait = 15  # seconds
-        for i in range(max_wait):
-            if discord_bot.user:
-                logger.info(f"Bot connected after {i+1} seconds as {discord_bot.user}")
-                # Wait a bit more for guilds to load
-                logger.info("Waiting for guilds to load...")
-                for j in range(5):  # Wait up to 5 more seconds for guilds
-                    await asyncio.sleep(1)
-                    if discord_bot.guilds:
-                        logger.info(
-                            f"Guilds loaded: {len(discord_bot.guilds)} guilds found"
-                        )
-                        break
-                    logger.info(f"Waiting for guilds: {j+1}s")
-                break
-            await asyncio.sleep(1)
-            logger.info(f"Waiting for bot to connect: {i+1}s")
-
-        if not discord_bot.user:
-            return {"error": "Bot failed to connect within timeout period"}
+        # Serialize startup: two tool calls racing on a cold server
+        # would otherwise both reach here and spawn duplicate bots
+        async with bot_state.lock:
+            # Another caller may have started the bot while we waited
+            if discord_bot and not discord_bot.is_closed() and discord_bot.user:
+                _bot_ready.set()
+                return {
+                    "success": True,
+                    "message": "Bot is already running",
+                    "bot_user": discord_bot._display_name or str(discord_bot.user),
+                    "guild_count": (
+                        len(discord_bot.guilds) if discord_bot.guilds else 0
+                    ),
+                }
+
+            # Create new bot instance
+            discord_bot = bot_state.bot = DiscordMCPBot(config)
+
+            # Start the bot in a background task
+            bot_task = bot_state.task = asyncio.create_task(discord_bot.start(token))
+            # If the bot task ever finishes (disconnect, crash, close),
+            # drop the fast path so require_discord_bot falls back to
+            # the probe-and-restart logic instead of running tools
+            # against a dead client
+            bot_task.add_done_callback(lambda _t: _bot_ready.clear())
+
+            # Wait for the gateway connection and initial guild sync;
+            # wait_until_ready wakes as soon as on_ready fires instead of
+            # polling once per second
+            try:
+                await asyncio.wait_for(discord_bot.wait_until_ready(), timeout=15)
+            except asyncio.TimeoutError:
+                _bot_ready.clear()
+                return {"error": "Bot failed to connect within timeout period"}
+
+            _bot_ready.set()
+
+        logger.info(f"Bot connected as {discord_bot.user}")
+        logger.info(f"Guilds loaded: {len(discord_bot.guilds)} guilds found")
 
         # Initialize server registry if not already done
         if not registry:
@@ -201,11 +271,12 @@ async def ensure_bot_running(token: str = "") -> dict:
         return {
             "success": True,
             "message": "Discord bot started successfully",
-            "bot_user": str(discord_bot.user),
+            "bot_user": discord_bot._display_name or str(discord_bot.user),
             "guild_count": (len(discord_bot.guilds) if discord_bot.guilds else 0),
         }
 
     except Exception as e:
+        _bot_ready.clear()
         logger.error(f"Failed to start Discord bot: {str(e)}")
         return {"error": f"Failed to start Discord bot: {str(e)}"}
 
@@ -229,6 +300,7 @@ async def discord_start_bot(token: str = ""):
     description="Get a server by name, alias, or ID",
 )
 @require_discord_bot
+@tool_errors("getting server")
 async def registry_get_server(reference: str, user_id: str = "system"):
     """Get a server by name, alias, or ID."""
     global registry
@@ -236,32 +308,28 @@ async def registry_get_server(reference: str, user_id: str = "system"):
     if not registry:
         return {"error": "Server registry not initialized"}
 
-    try:
-        # Set the current user for context tracking
-        registry.set_current_user(user_id)
-
-        # Get the server
-        server = registry.api.get_server(reference)
-        if server:
-            # Track this server in context
-            registry.track_context("server", server.id)
-
-            return {
-                "success": True,
-                "server": {
-                    "id": server.discord_id,  # Use Discord ID directly
-                    "name": server.name,
-                    "description": server.description,
-                },
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Server '{reference}' not found",
-            }
-    except Exception as e:
-        logger.error(f"Error getting server: {str(e)}")
-        return {"error": f"Error getting server: {str(e)}"}
+    # Set the current user for context tracking
+    registry.set_current_user(user_id)
+
+    # Get the server
+    server = registry.api.get_server(reference)
+    if server:
+        # Track this server in context
+        registry.track_context("server", server.id)
+
+        return {
+            "success": True,
+            "server": {
+                "id": server.discord_id,  # Use Discord ID directly
+                "name": server.name,
+                "description": server.description,
+            },
+        }
+    else:
+        return {
+            "success": False,
+            "error": f"Server '{reference}' not found",
+        }
 
 
 @mcp.tool(
@@ -269,6 +337,7 @@ async def registry_get_server(reference: str, user_id: str = "system"):
     description="Get a channel by name, alias, or ID",
 )
 @require_discord_bot
+@tool_errors("getting channel")
 async def registry_get_channel(
     reference: str, server_reference: str = None, user_id: str = "system"
 ):
@@ -278,36 +347,32 @@ async def registry_get_channel(
     if not registry:
         return {"error": "Server registry not initialized"}
 
-    try:
-        # Set the current user for context tracking
-        registry.set_current_user(user_id)
-
-        # Get the channel
-        channel = registry.api.get_channel(reference, server_reference)
-        if channel:
-            # Track this channel in context
-            registry.track_context("channel", channel.id)
-
-            return {
-                "success": True,
-                "channel": {
-                    "id": channel.discord_id,  # Use Discord ID directly
-                    "name": channel.name,
-                    "type": (
-                        channel.type.value
-                        if hasattr(channel.type, "value")
-                        else str(channel.type)
-                    ),
-                },
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Channel '{reference}' not found",
-            }
-    except Exception as e:
-        logger.error(f"Error getting channel: {str(e)}")
-        return {"error": f"Error getting channel: {str(e)}"}
+    # Set the current user for context tracking
+    registry.set_current_user(user_id)
+
+    # Get the channel
+    channel = registry.api.get_channel(reference, server_reference)
+    if channel:
+        # Track this channel in context
+        registry.track_context("channel", channel.id)
+
+        return {
+            "success": True,
+            "channel": {
+                "id": channel.discord_id,  # Use Discord ID directly
+                "name": channel.name,
+                "type": (
+                    channel.type.value
+                    if hasattr(channel.type, "value")
+                    else str(channel.type)
+                ),
+            },
+        }
+    else:
+        return {
+            "success": False,
+            "error": f"Channel '{reference}' not found",
+        }
 
 
 @mcp.tool(
@@ -315,6 +380,7 @@ async def registry_get_channel(
     description="Get a role by name, alias, or ID",
 )
 @require_discord_bot
+@tool_errors("getting role")
 async def registry_get_role(
     reference: str, server_reference: str = None, user_id: str = "system"
 ):
@@ -324,30 +390,26 @@ async def registry_get_role(
     if not registry:
         return {"error": "Server registry not initialized"}
 
-    try:
-        # Set the current user for context tracking
-        registry.set_current_user(user_id)
-
-        # Get the role
-        role = registry.api.get_role(reference, server_reference)
-        if role:
-            # Track this role in context
-            registry.track_context("role", role.id)
-
-            return {
-                "success": True,
-                "role": {
-                    "id": role.discord_id,  # Use Discord ID directly
-                    "name": role.name,
-                    "color": role.color,
-                    "mentionable": role.mentionable,
-                },
-            }
-        else:
-            return {"success": False, "error": f"Role '{reference}' not found"}
-    except Exception as e:
-        logger.error(f"Error getting role: {str(e)}")
-        return {"error": f"Error getting role: {str(e)}"}
+    # Set the current user for context tracking
+    registry.set_current_user(user_id)
+
+    # Get the role
+    role = registry.api.get_role(reference, server_reference)
+    if role:
+        # Track this role in context
+        registry.track_context("role", role.id)
+
+        return {
+            "success": True,
+            "role": {
+                "id": role.discord_id,  # Use Discord ID directly
+                "name": role.name,
+                "color": role.color,
+                "mentionable": role.mentionable,
+            },
+        }
+    else:
+        return {"success": False, "error": f"Role '{reference}' not found"}
 
 
 @mcp.tool(
@@ -355,6 +417,7 @@ async def registry_get_role(
     description="Update the server registry with current Discord data",
 )
 @require_discord_bot
+@tool_errors("updating registry")
 async def registry_update(server_id: str = ""):
     """Update the server registry with current Discord data."""
     global registry
@@ -362,12 +425,7 @@ async def registry_update(server_id: str = ""):
     if not registry:
         return {"error": "Server registry not initialized"}
 
-    try:
-        result = await registry.update_registry(server_id if server_id else None)
-        return result
-    except Exception as e:
-        logger.error(f"Error updating registry: {str(e)}")
-        return {"error": f"Error updating registry: {str(e)}"}
+    return await registry.update_registry(server_id if server_id else None)
 
 
 @mcp.tool(
@@ -375,6 +433,7 @@ async def registry_update(server_id: str = ""):
     description="Track an entity in the conversation context",
 )
 @require_discord_bot
+@tool_errors("tracking context")
 async def registry_track_context(
     entity_type: str,
     entity_id: str,
@@ -386,25 +445,19 @@ async def registry_track_context(
     if not registry:
         return {"error": "Server registry not initialized"}
 
-    try:
-        # Set the current user for context tracking
-        registry.set_current_user(user_id)
+    # Set the current user for context tracking
+    registry.set_current_user(user_id)
 
-        # Track the entity
-        success = registry.track_context(entity_type, int(entity_id))
+    # Track the entity
+    success = registry.track_context(entity_type, int(entity_id))
 
-        if success:
-            return {
-                "success": True,
-                "message": f"Entity {entity_type}:{entity_id} tracked in context for user {user_id}",
-            }
-        else:
-            return {
-                "error": f"Failed to track entity {entity_type}:{entity_id} in context"
-            }
-    except Exception as e:
-        logger.error(f"Error tracking context: {str(e)}")
-        return {"error": f"Error tracking context: {str(e)}"}
+    if success:
+        return {
+            "success": True,
+            "message": f"Entity {entity_type}:{entity_id} tracked in context for user {user_id}",
+        }
+    else:
+        return {"error": f"Failed to track entity {entity_type}:{entity_id} in context"}
 
 
 # discord_list_channels tool removed - using server_registry_tools.get_server_channels instead
@@ -483,6 +536,18 @@ def run_server() -> None:
 
 def main() -> None:
     """Main entry point for the discord-mcp console script."""
+    # Prefer uvloop where available (the optional "perf" extra); it cuts
+    # per-callback event-loop overhead for the many small gateway and
+    # JSON-RPC handles this server juggles. Windows keeps the default
+    # proactor policy.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
+
     try:
         run_server()
     except KeyboardInterrupt:
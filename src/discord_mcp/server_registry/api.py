@@ -3,6 +3,7 @@ API for server registry.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any
 
@@ -11,6 +12,10 @@ from .services import ServerRegistryService, ContextManagerService
 
 logger = logging.getLogger(__name__)
 
+# Discord snowflake IDs are 17-20 digit integers; references matching
+# this can be resolved with an O(1) cache lookup instead of a scan
+_is_snowflake = re.compile(r"^\d{17,20}$").match
+
 
 class ServerRegistryAPI(ABC):
     """
@@ -170,9 +175,9 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
             discord_client (Any, optional): The Discord client to use for API calls.
         """
         # Initialize database connection
-        from .db import DatabaseConnection
+        from .db import get_db
 
-        db = DatabaseConnection()
+        db = get_db()
 
         # Initialize repositories with database connection
         from .repositories import (
@@ -197,6 +202,41 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
         self.discord_client = discord_client
         self.current_user_id = None
 
+        # guild_id -> {lower channel name: channel_id}, built lazily and
+        # invalidated by channel gateway events, so exact-name channel
+        # lookups are one dict hit instead of a scan over every guild
+        self._channel_name_index: Dict[int, Dict[str, int]] = {}
+        self._channel_listeners_attached = False
+
+    def _attach_channel_listeners(self) -> None:
+        """Register channel CRUD listeners that invalidate the name index."""
+        if self._channel_listeners_attached:
+            return
+        add_listener = getattr(self.discord_client, "add_listener", None)
+        if add_listener is None:
+            return
+
+        async def _invalidate(channel, *args):
+            self._channel_name_index.pop(channel.guild.id, None)
+
+        for event in (
+            "on_guild_channel_create",
+            "on_guild_channel_update",
+            "on_guild_channel_delete",
+        ):
+            add_listener(_invalidate, event)
+        self._channel_listeners_attached = True
+
+    def _guild_channel_index(self, guild) -> Dict[str, int]:
+        """Return the lower-name -> channel id map for one guild."""
+        self._attach_channel_listeners()
+        index = self._channel_name_index.get(guild.id)
+        if index is None:
+            index = self._channel_name_index[guild.id] = {
+                channel.name.lower(): channel.id for channel in guild.channels
+            }
+        return index
+
     def get_server(
         self, reference: str, context: Optional[ConversationContext] = None
     ) -> Optional[Server]:
@@ -236,8 +276,24 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
             if server:
                 return server
 
-            # 5. Fall back to Discord client search (for partial matches)
+            # 5. Try a partial-name search in the database (the LIKE
+            # scan runs in SQLite's C engine, not a Python loop)
+            matches = server_repo.search_servers_by_name(reference)
+            if matches:
+                return matches[0]
+
+            # 6. Fall back to Discord client search (for partial matches)
             if self.discord_client:
+                # Snowflake references resolve via the client's guild
+                # dict without iterating every guild
+                if _is_snowflake(reference):
+                    guild = self.discord_client.get_guild(int(reference))
+                    if guild:
+                        return Server(
+                            discord_id=str(guild.id),
+                            name=guild.name,
+                        )
+
                 for guild in self.discord_client.guilds:
                     if reference.lower() in guild.name.lower() or reference == str(
                         guild.id
@@ -305,11 +361,42 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
 
             # 5. Fall back to Discord client search (for partial matches)
             if self.discord_client:
+                # Snowflake references hit the client's global channel
+                # cache directly instead of scanning every guild
+                if _is_snowflake(reference):
+                    channel = self.discord_client.get_channel(int(reference))
+                    if channel is not None:
+                        from .models import ChannelType
+
+                        return Channel(
+                            discord_id=str(channel.id),
+                            server_id=server_id or 0,
+                            name=channel.name,
+                            type=ChannelType.from_string(str(channel.type)),
+                        )
+
                 if server_reference:
                     server = self.get_server(server_reference, context)
                     if server:
                         guild = self.discord_client.get_guild(int(server.discord_id))
                         if guild:
+                            # Exact-name hit via the per-guild index
+                            # before falling back to the substring scan
+                            channel_id = self._guild_channel_index(guild).get(
+                                reference.lower()
+                            )
+                            if channel_id is not None:
+                                channel = guild.get_channel(channel_id)
+                                if channel is not None:
+                                    from .models import ChannelType
+
+                                    return Channel(
+                                        discord_id=str(channel.id),
+                                        server_id=int(server.id or 0),
+                                        name=channel.name,
+                                        type=ChannelType.from_string(str(channel.type)),
+                                    )
+
                             for channel in guild.channels:
                                 if (
                                     reference.lower() in channel.name.lower()
@@ -324,7 +411,25 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
                                         type=ChannelType.from_string(str(channel.type)),
                                     )
                 else:
-                    # Search all servers
+                    # Search all servers: exact-name index lookups first
+                    # (one dict hit per guild), substring scan second
+                    reference_lower = reference.lower()
+                    for guild in self.discord_client.guilds:
+                        channel_id = self._guild_channel_index(guild).get(
+                            reference_lower
+                        )
+                        if channel_id is not None:
+                            channel = guild.get_channel(channel_id)
+                            if channel is not None:
+                                from .models import ChannelType
+
+                                return Channel(
+                                    discord_id=str(channel.id),
+                                    server_id=0,
+                                    name=channel.name,
+                                    type=ChannelType.from_string(str(channel.type)),
+                                )
+
                     for guild in self.discord_client.guilds:
                         for channel in guild.channels:
                             if (
@@ -372,6 +477,22 @@ class ServerRegistryAPIImpl(ServerRegistryAPI):
 
         # For now, just create a dummy role
         if self.discord_client:
+            # Snowflake references resolve per-guild via get_role, an
+            # O(1) dict lookup, instead of scanning every role
+            if _is_snowflake(reference):
+                role_id = int(reference)
+                for guild in self.discord_client.guilds:
+                    role = guild.get_role(role_id)
+                    if role is not None:
+                        return Role(
+                            discord_id=str(role.id),
+                            server_id=0,
+                            name=role.name,
+                            color=role.color.value,
+                            position=role.position,
+                            mentionable=role.mentionable,
+                        )
+
             # If server_reference is provided, limit search to that server
             if server_reference:
                 server = self.get_server(server_reference, context)
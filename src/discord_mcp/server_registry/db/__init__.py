@@ -2,6 +2,6 @@
 Database module for server registry.
 """
 
-from .connection import DatabaseConnection
+from .connection import DatabaseConnection, get_db
 
-__all__ = ["DatabaseConnection"]
+__all__ = ["DatabaseConnection", "get_db"]
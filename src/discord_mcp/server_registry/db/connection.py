@@ -2,72 +2,177 @@
 Database connection for server registry.
 """
 
+import hashlib
 import os
 import sqlite3
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseConnection:
     """
-    Singleton class for managing SQLite database connections.
+    Manages SQLite database connections for the server registry.
     Provides methods for executing SQL queries and managing transactions.
+
+    Call sites that want the shared instance should use get_db()
+    rather than constructing one directly.
     """
 
-    _instance = None
-    _connection = None
+    def __init__(self, db_path: str = None):
+        self._connection = None
+        self._in_transaction = False
+        # WAL supports one writer plus concurrent readers: writes
+        # share a single connection created under a lock, while
+        # each thread gets its own read connection
+        self._writer_lock = threading.Lock()
+        self._tls = threading.local()
+
+        # Check environment variable first, then parameter, then default
+        if not db_path:
+            db_path = os.getenv("MCP_DISCORD_DB_PATH")
+
+        if not db_path:
+            # Default to a file in the user's home directory
+            home_dir = os.path.expanduser("~")
+            db_dir = os.path.join(home_dir, ".mcp_discord")
+            os.makedirs(db_dir, exist_ok=True)
+            db_path = os.path.join(db_dir, "server_registry.db")
 
-    def __new__(cls, db_path: str = None):
-        if cls._instance is None:
-            cls._instance = super(DatabaseConnection, cls).__new__(cls)
-            cls._instance._connection = None
+        self._db_path = db_path
+        # Ensure the directory exists once here, so opening
+        # connections later involves no filesystem syscalls beyond
+        # the sqlite open itself
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        logger.info(f"Using database at: {db_path}")
 
-            # Check environment variable first, then parameter, then default
-            if not db_path:
-                db_path = os.getenv("MCP_DISCORD_DB_PATH")
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a configured connection to the registry database."""
+        # isolation_level=None leaves transaction control to this class
+        # instead of the driver's implicit BEGIN, and
+        # check_same_thread=False allows reuse from worker threads
+        # (sqlite3 serializes access itself). cached_statements sizes
+        # sqlite3's internal LRU of prepared statements (keyed by SQL
+        # text); keeping it above the number of distinct queries the
+        # repositories issue means hot point lookups skip re-parsing
+        # and re-planning
+        connection = sqlite3.connect(
+            self._db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
 
-            if not db_path:
-                # Default to a file in the user's home directory
-                home_dir = os.path.expanduser("~")
-                db_dir = os.path.join(home_dir, ".mcp_discord")
-                os.makedirs(db_dir, exist_ok=True)
-                db_path = os.path.join(db_dir, "server_registry.db")
+        # WAL turns each commit into a log append instead of a
+        # full-journal rewrite plus fsync, and lets readers run
+        # concurrently with the writer; the remaining PRAGMAs trade
+        # a little durability-on-power-loss for far fewer syncs,
+        # keep temp structures and a 20MB page cache in memory, and
+        # wait out short-lived locks instead of failing immediately
+        connection.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-20000;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA busy_timeout=5000;"
+            "PRAGMA foreign_keys=ON;"
+        )
+        mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        if mode != "wal":
+            # e.g. read-only or network filesystems reject WAL; the
+            # connection still works with the default journal
+            logger.warning(f"WAL unavailable, journal_mode={mode}")
 
-            cls._instance._db_path = db_path
-            logger.info(f"Using database at: {db_path}")
-        return cls._instance
+        connection.row_factory = sqlite3.Row
+        return connection
 
     def get_connection(self) -> sqlite3.Connection:
         """
-        Get a connection to the SQLite database.
+        Get the shared write connection to the SQLite database.
 
         Returns:
             sqlite3.Connection: The database connection.
         """
         if self._connection is None:
-            # Ensure the directory exists
-            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
-
-            # Connect to the database
-            self._connection = sqlite3.connect(self._db_path)
-
-            # Enable foreign keys
-            self._connection.execute("PRAGMA foreign_keys = ON")
+            with self._writer_lock:
+                if self._connection is None:
+                    self._connection = self._open_connection()
+        return self._connection
 
-            # Configure connection
-            self._connection.row_factory = sqlite3.Row
+    def _reader(self) -> sqlite3.Connection:
+        """Get this thread's read connection, opening it on first use.
 
-        return self._connection
+        Under WAL, readers on their own connections run concurrently
+        with the writer instead of serializing on one shared handle.
+        Reads issued inside an open transaction go through the writer
+        so they observe its uncommitted rows.
+        """
+        if self._in_transaction:
+            return self.get_connection()
+        connection = getattr(self._tls, "connection", None)
+        if connection is None:
+            connection = self._tls.connection = self._open_connection()
+        return connection
 
     def close(self) -> None:
         """
-        Close the database connection.
+        Close the database connections held by this thread.
         """
         if self._connection is not None:
             self._connection.close()
             self._connection = None
+        connection = getattr(self._tls, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._tls.connection = None
+
+    @contextmanager
+    def transaction(self):
+        """Group writes into one BEGIN IMMEDIATE ... COMMIT block.
+
+        The per-statement commits in execute_insert/execute_update are
+        suppressed inside the block, so N writes share a single fsync.
+        Nested use is safe: the outermost block owns the transaction.
+        """
+        conn = self.get_connection()
+        if self._in_transaction:
+            yield conn
+            return
+        self._in_transaction = True
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._in_transaction = False
+
+    def executemany(self, query: str, seq_of_params: Iterable[Tuple]) -> int:
+        """
+        Execute one statement for many parameter tuples.
+
+        Args:
+            query (str): The SQL query.
+            seq_of_params (Iterable[Tuple]): One parameter tuple per row.
+
+        Returns:
+            int: The number of affected rows.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany(query, seq_of_params)
+        if not self._in_transaction:
+            conn.commit()
+        affected_rows = cursor.rowcount
+        cursor.close()
+        return affected_rows
 
     def execute_query(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
         """
@@ -80,13 +185,33 @@ class DatabaseConnection:
         Returns:
             List[Dict[str, Any]]: The query results.
         """
-        conn = self.get_connection()
+        conn = self._reader()
         cursor = conn.cursor()
         cursor.execute(query, params)
         results = [dict(row) for row in cursor.fetchall()]
         cursor.close()
         return results
 
+    def execute_iter(self, query: str, params: Tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Execute a query and yield rows without materializing dicts.
+
+        Large result sets avoid one dict allocation per row; rows
+        support mapping-style access via sqlite3.Row.
+
+        Args:
+            query (str): The SQL query.
+            params (Tuple, optional): The query parameters. Defaults to ().
+
+        Yields:
+            sqlite3.Row: The result rows.
+        """
+        cursor = self._reader().execute(query, params)
+        try:
+            yield from cursor
+        finally:
+            cursor.close()
+
     def execute_insert(self, query: str, params: Tuple = ()) -> int:
         """
         Execute an insert query and return the last inserted row ID.
@@ -101,7 +226,8 @@ class DatabaseConnection:
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute(query, params)
-        conn.commit()
+        if not self._in_transaction:
+            conn.commit()
         last_id = cursor.lastrowid
         cursor.close()
         return last_id
@@ -120,18 +246,65 @@ class DatabaseConnection:
         conn = self.get_connection()
         cursor = conn.cursor()
         cursor.execute(query, params)
-        conn.commit()
+        if not self._in_transaction:
+            conn.commit()
         affected_rows = cursor.rowcount
         cursor.close()
         return affected_rows
 
     def execute_script(self, script: str) -> None:
         """
-        Execute a SQL script.
+        Execute a SQL script, skipping scripts already applied.
+
+        The schema script is re-run at every process start; instead of
+        re-parsing kilobytes of DDL (and taking the WAL write lock)
+        each boot, a hash of each applied script is recorded in a
+        schema_meta table and an identical script becomes a single
+        point lookup. Any edit to the script changes the hash, so it
+        runs again — this doubles as a migration guard.
 
         Args:
             script (str): The SQL script.
         """
         conn = self.get_connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS schema_meta (key TEXT PRIMARY KEY, value TEXT)"
+        )
+        # blake2s beats sha256 on short inputs and 8 bytes is plenty
+        # for distinguishing schema revisions
+        script_hash = hashlib.blake2s(script.encode(), digest_size=8).hexdigest()
+        key = f"script:{script_hash}"
+        row = conn.execute("SELECT 1 FROM schema_meta WHERE key = ?", (key,)).fetchone()
+        if row:
+            return
         conn.executescript(script)
+        conn.execute(
+            "INSERT OR REPLACE INTO schema_meta (key, value) VALUES (?, '')", (key,)
+        )
         conn.commit()
+
+
+_db: Optional[DatabaseConnection] = None
+
+
+def get_db(db_path: str = None) -> DatabaseConnection:
+    """
+    Get the shared DatabaseConnection, creating it on first call.
+
+    Replaces the previous __new__-based singleton: callers on hot
+    paths (every repository default constructor) now do one module
+    attribute load and an identity check instead of running the
+    instance-check and attribute machinery inside __new__ each time.
+    As before, the first caller's db_path wins.
+
+    Args:
+        db_path (str, optional): Path to the database file, used only
+            when the shared instance does not exist yet.
+
+    Returns:
+        DatabaseConnection: The shared connection manager.
+    """
+    global _db
+    if _db is None:
+        _db = DatabaseConnection(db_path)
+    return _db
@@ -18,8 +18,7 @@ def initialize_database(db: DatabaseConnection) -> None:
     logger.info("Initializing database schema")
 
     # Create tables
-    db.execute_script(
-        """
+    db.execute_script("""
         -- Servers table
         CREATE TABLE IF NOT EXISTS servers (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -115,6 +114,15 @@ def initialize_database(db: DatabaseConnection) -> None:
             UNIQUE (role_id, alias)
         );
 
+        -- Name-lookup indexes: the repositories match on LOWER(name),
+        -- which without these forces a full table scan per lookup
+        CREATE INDEX IF NOT EXISTS servers_name_lower_idx
+            ON servers (LOWER(name));
+        CREATE INDEX IF NOT EXISTS channels_name_lower_idx
+            ON channels (LOWER(name), server_id);
+        CREATE INDEX IF NOT EXISTS roles_name_lower_idx
+            ON roles (LOWER(name), server_id);
+
         -- Conversation context table
         CREATE TABLE IF NOT EXISTS conversation_context (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -124,7 +132,31 @@ def initialize_database(db: DatabaseConnection) -> None:
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             UNIQUE (user_id, entity_type, entity_id)
         );
-        """
-    )
+        """)
+
+    # Derived alias columns: lower(name) with spaces stripped matches
+    # the base aliases the generators used to persist per entity, so
+    # those lookups become one indexed probe and the alias tables only
+    # carry the suffixed/special forms. Added via ALTER because
+    # CREATE TABLE IF NOT EXISTS never touches existing tables.
+    for table, index_columns in (
+        ("servers", "alias_key"),
+        ("channels", "alias_key, server_id"),
+        ("roles", "alias_key, server_id"),
+    ):
+        # table_xinfo, not table_info: only the former lists
+        # generated virtual columns
+        columns = {
+            row["name"] for row in db.execute_query(f"PRAGMA table_xinfo({table})")
+        }
+        if "alias_key" not in columns:
+            db.execute_update(
+                f"ALTER TABLE {table} ADD COLUMN alias_key TEXT"
+                " GENERATED ALWAYS AS (lower(replace(name, ' ', ''))) VIRTUAL"
+            )
+        db.execute_update(
+            f"CREATE INDEX IF NOT EXISTS {table}_alias_key_idx"
+            f" ON {table} ({index_columns})"
+        )
 
     logger.info("Database schema initialized successfully")
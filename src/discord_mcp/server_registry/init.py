@@ -6,7 +6,7 @@ import logging
 from typing import Optional, Dict, Any
 from pathlib import Path
 
-from .db import DatabaseConnection
+from .db import get_db
 from .db.init_db import initialize_database
 from .api import ServerRegistryAPIImpl
 from ..database.migrations import initialize_campaign_database
@@ -29,7 +29,7 @@ def init_server_registry(
     """
     try:
         # Initialize database connection
-        db_conn = DatabaseConnection(db_path)
+        db_conn = get_db(db_path)
 
         # Initialize database schema
         initialize_database(db_conn)
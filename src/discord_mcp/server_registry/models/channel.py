@@ -38,7 +38,7 @@ class ChannelType(Enum):
             return cls.TEXT
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelPermissions:
     """
     Represents the bot's permissions in a channel.
@@ -88,7 +88,7 @@ class ChannelPermissions:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Channel:
     """
     Represents a Discord channel in the registry.
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Role:
     """
     Represents a Discord role in the registry.
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerPermissions:
     """
     Represents the bot's permissions in a server.
@@ -54,7 +54,7 @@ class ServerPermissions:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Server:
     """
     Represents a Discord server in the registry.
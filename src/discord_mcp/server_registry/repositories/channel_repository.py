@@ -3,13 +3,73 @@ Channel repository.
 """
 
 import logging
+import sys
 from typing import Dict, List, Optional, Any
 
-from ..db import DatabaseConnection
+from ..db import DatabaseConnection, get_db
 from ..models import Channel, ChannelPermissions
 
 logger = logging.getLogger(__name__)
 
+# SQL hoisted to module constants: every call passes the same str
+# object, so the sqlite3 prepared-statement cache keys on an
+# already-hashed identical string instead of hashing a fresh literal
+# loaded inside each method.
+_SQL_GET_BY_ID = "SELECT * FROM channels WHERE id = ?"
+_SQL_GET_BY_DISCORD_ID = "SELECT * FROM channels WHERE discord_id = ?"
+_SQL_GET_BY_NAME_IN_SERVER = (
+    "SELECT * FROM channels WHERE LOWER(name) = LOWER(?) AND server_id = ?"
+)
+_SQL_GET_BY_NAME = "SELECT * FROM channels WHERE LOWER(name) = LOWER(?)"
+_SQL_GET_BY_ALIAS_KEY_IN_SERVER = (
+    "SELECT * FROM channels WHERE alias_key = ? AND server_id = ?"
+)
+_SQL_GET_BY_ALIAS_KEY = "SELECT * FROM channels WHERE alias_key = ?"
+_SQL_GET_BY_ALIAS_IN_SERVER = """
+    SELECT c.* FROM channels c
+    JOIN channel_aliases ca ON c.id = ca.channel_id
+    WHERE LOWER(ca.alias) = LOWER(?) AND c.server_id = ?
+"""
+_SQL_GET_BY_ALIAS = """
+    SELECT c.* FROM channels c
+    JOIN channel_aliases ca ON c.id = ca.channel_id
+    WHERE LOWER(ca.alias) = LOWER(?)
+"""
+_SQL_GET_BY_SERVER = (
+    "SELECT * FROM channels WHERE server_id = ? ORDER BY position, name"
+)
+_SQL_INSERT = """
+    INSERT INTO channels (discord_id, server_id, name, type, topic, position, parent_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE = """
+    UPDATE channels
+    SET name = ?, type = ?, topic = ?, position = ?, parent_id = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_DELETE = "DELETE FROM channels WHERE id = ?"
+_SQL_INSERT_ALIAS = (
+    "INSERT OR IGNORE INTO channel_aliases (channel_id, alias) VALUES (?, ?)"
+)
+_SQL_DELETE_PERMISSIONS = "DELETE FROM channel_permissions WHERE channel_id = ?"
+_SQL_INSERT_PERMISSION = """
+    INSERT INTO channel_permissions (channel_id, permission_name, permission_value)
+    VALUES (?, ?, ?)
+"""
+_SQL_UPSERT_MANY = """
+    INSERT INTO channels (discord_id, server_id, name, type, topic, position, parent_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(discord_id) DO UPDATE SET
+        server_id = excluded.server_id,
+        name = excluded.name,
+        type = excluded.type,
+        topic = excluded.topic,
+        position = excluded.position,
+        parent_id = excluded.parent_id,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_SQL_IDS_BY_SERVER = "SELECT id, discord_id FROM channels WHERE server_id = ?"
+
 
 class ChannelRepository:
     """
@@ -23,7 +83,14 @@ class ChannelRepository:
         Args:
             db (DatabaseConnection, optional): The database connection.
         """
-        self.db = db or DatabaseConnection()
+        self.db = db or get_db()
+
+        # In-memory lookup caches keyed by (server_id, lowercase text).
+        # Name and alias lookups repeat heavily between writes, so they
+        # are served from a dict hit instead of a SQL round-trip; any
+        # write clears both caches.
+        self._name_cache: Dict[Any, Optional[Channel]] = {}
+        self._alias_cache: Dict[Any, Optional[Channel]] = {}
 
     def get_channel_by_id(self, channel_id: int) -> Optional[Channel]:
         """
@@ -36,9 +103,7 @@ class ChannelRepository:
             Optional[Channel]: The channel if found, None otherwise.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM channels WHERE id = ?", (channel_id,)
-            )
+            results = self.db.execute_query(_SQL_GET_BY_ID, (channel_id,))
             if results:
                 return self._row_to_channel(results[0])
             return None
@@ -57,9 +122,7 @@ class ChannelRepository:
             Optional[Channel]: The channel if found, None otherwise.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM channels WHERE discord_id = ?", (discord_id,)
-            )
+            results = self.db.execute_query(_SQL_GET_BY_DISCORD_ID, (discord_id,))
             if results:
                 return self._row_to_channel(results[0])
             return None
@@ -81,20 +144,20 @@ class ChannelRepository:
             Optional[Channel]: The channel if found, None otherwise.
         """
         try:
+            key = (server_id, sys.intern(name.lower()))
+            if key in self._name_cache:
+                return self._name_cache[key]
+
             if server_id:
                 results = self.db.execute_query(
-                    "SELECT * FROM channels WHERE LOWER(name) = LOWER(?) AND server_id = ?",
-                    (name, server_id),
+                    _SQL_GET_BY_NAME_IN_SERVER, (name, server_id)
                 )
             else:
-                results = self.db.execute_query(
-                    "SELECT * FROM channels WHERE LOWER(name) = LOWER(?)",
-                    (name,),
-                )
+                results = self.db.execute_query(_SQL_GET_BY_NAME, (name,))
 
-            if results:
-                return self._row_to_channel(results[0])
-            return None
+            channel = self._row_to_channel(results[0]) if results else None
+            self._name_cache[key] = channel
+            return channel
         except Exception as e:
             logger.error(f"Error getting channel by name {name}: {e}")
             return None
@@ -113,28 +176,30 @@ class ChannelRepository:
             Optional[Channel]: The channel if found, None otherwise.
         """
         try:
+            key = (server_id, sys.intern(alias.lower()))
+            if key in self._alias_cache:
+                return self._alias_cache[key]
+
+            # Base aliases (name, name without spaces) are served by
+            # the generated alias_key column in one indexed probe; the
+            # alias table join only runs for suffixed/special forms
+            alias_key = alias.lower().replace(" ", "")
             if server_id:
                 results = self.db.execute_query(
-                    """
-                    SELECT c.* FROM channels c
-                    JOIN channel_aliases ca ON c.id = ca.channel_id
-                    WHERE LOWER(ca.alias) = LOWER(?) AND c.server_id = ?
-                    """,
-                    (alias, server_id),
+                    _SQL_GET_BY_ALIAS_KEY_IN_SERVER, (alias_key, server_id)
                 )
+                if not results:
+                    results = self.db.execute_query(
+                        _SQL_GET_BY_ALIAS_IN_SERVER, (alias, server_id)
+                    )
             else:
-                results = self.db.execute_query(
-                    """
-                    SELECT c.* FROM channels c
-                    JOIN channel_aliases ca ON c.id = ca.channel_id
-                    WHERE LOWER(ca.alias) = LOWER(?)
-                    """,
-                    (alias,),
-                )
+                results = self.db.execute_query(_SQL_GET_BY_ALIAS_KEY, (alias_key,))
+                if not results:
+                    results = self.db.execute_query(_SQL_GET_BY_ALIAS, (alias,))
 
-            if results:
-                return self._row_to_channel(results[0])
-            return None
+            channel = self._row_to_channel(results[0]) if results else None
+            self._alias_cache[key] = channel
+            return channel
         except Exception as e:
             logger.error(f"Error getting channel by alias {alias}: {e}")
             return None
@@ -150,11 +215,12 @@ class ChannelRepository:
             List[Channel]: The channels.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM channels WHERE server_id = ? ORDER BY position, name",
-                (server_id,),
-            )
-            return [self._row_to_channel(row) for row in results]
+            # Stream sqlite3.Row objects straight into Channel objects
+            # instead of materializing an intermediate dict per row
+            return [
+                self._row_to_channel(row)
+                for row in self.db.execute_iter(_SQL_GET_BY_SERVER, (server_id,))
+            ]
         except Exception as e:
             logger.error(f"Error getting channels for server {server_id}: {e}")
             return []
@@ -170,11 +236,10 @@ class ChannelRepository:
             Channel: The created channel with ID.
         """
         try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
             channel_id = self.db.execute_insert(
-                """
-                INSERT INTO channels (discord_id, server_id, name, type, topic, position, parent_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT,
                 (
                     channel.discord_id,
                     channel.server_id,
@@ -212,12 +277,10 @@ class ChannelRepository:
             Channel: The updated channel.
         """
         try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
             self.db.execute_update(
-                """
-                UPDATE channels
-                SET name = ?, type = ?, topic = ?, position = ?, parent_id = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE,
                 (
                     channel.name,
                     (
@@ -247,9 +310,9 @@ class ChannelRepository:
             bool: True if the channel was deleted, False otherwise.
         """
         try:
-            affected_rows = self.db.execute_update(
-                "DELETE FROM channels WHERE id = ?", (channel_id,)
-            )
+            self._name_cache.clear()
+            self._alias_cache.clear()
+            affected_rows = self.db.execute_update(_SQL_DELETE, (channel_id,))
             return affected_rows > 0
         except Exception as e:
             logger.error(f"Error deleting channel {channel_id}: {e}")
@@ -267,10 +330,8 @@ class ChannelRepository:
             bool: True if the alias was added, False otherwise.
         """
         try:
-            self.db.execute_insert(
-                "INSERT OR IGNORE INTO channel_aliases (channel_id, alias) VALUES (?, ?)",
-                (channel_id, alias),
-            )
+            self._alias_cache.clear()
+            self.db.execute_insert(_SQL_INSERT_ALIAS, (channel_id, alias))
             return True
         except Exception as e:
             logger.error(
@@ -293,10 +354,7 @@ class ChannelRepository:
         """
         try:
             # Delete existing permissions
-            self.db.execute_update(
-                "DELETE FROM channel_permissions WHERE channel_id = ?",
-                (channel_id,),
-            )
+            self.db.execute_update(_SQL_DELETE_PERMISSIONS, (channel_id,))
 
             # Insert new permissions
             permission_attrs = [
@@ -313,10 +371,7 @@ class ChannelRepository:
                 if hasattr(permissions, perm_name):
                     perm_value = getattr(permissions, perm_name)
                     self.db.execute_insert(
-                        """
-                        INSERT INTO channel_permissions (channel_id, permission_name, permission_value)
-                        VALUES (?, ?, ?)
-                        """,
+                        _SQL_INSERT_PERMISSION,
                         (channel_id, perm_name, perm_value),
                     )
 
@@ -344,13 +399,70 @@ class ChannelRepository:
             server_id=row["server_id"],
             name=row["name"],
             type=ChannelType.from_string(row["type"]),
-            topic=row.get("topic"),
-            position=row.get("position"),
-            parent_id=row.get("parent_id"),
+            topic=row["topic"],
+            position=row["position"],
+            parent_id=row["parent_id"],
         )
         channel.id = row["id"]
         return channel
 
+    def bulk_upsert_channels(self, channels: List[Channel]) -> None:
+        """
+        Upsert many channels and their aliases in one transaction.
+
+        One executemany handles the channel rows (matching on the
+        discord_id unique constraint so existing ids are preserved),
+        one SELECT maps discord ids back to row ids, and one
+        executemany inserts the aliases — three statements for the
+        whole batch instead of several per channel.
+
+        Args:
+            channels (List[Channel]): The channels to upsert.
+        """
+        if not channels:
+            return
+        try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
+            with self.db.transaction():
+                self.db.executemany(
+                    _SQL_UPSERT_MANY,
+                    [
+                        (
+                            channel.discord_id,
+                            channel.server_id,
+                            channel.name,
+                            (
+                                channel.type.value
+                                if hasattr(channel.type, "value")
+                                else str(channel.type)
+                            ),
+                            channel.topic,
+                            channel.position,
+                            channel.parent_id,
+                        )
+                        for channel in channels
+                    ],
+                )
+
+                ids = {
+                    row["discord_id"]: row["id"]
+                    for row in self.db.execute_query(
+                        _SQL_IDS_BY_SERVER, (channels[0].server_id,)
+                    )
+                }
+                alias_rows = []
+                for channel in channels:
+                    channel.id = ids.get(channel.discord_id)
+                    if channel.id and channel.aliases:
+                        alias_rows.extend(
+                            (channel.id, alias) for alias in channel.aliases
+                        )
+                if alias_rows:
+                    self.db.executemany(_SQL_INSERT_ALIAS, alias_rows)
+        except Exception as e:
+            logger.error(f"Error bulk upserting {len(channels)} channels: {e}")
+
     def upsert_channel(self, channel: Channel) -> Channel:
         """
         Insert or update a channel (upsert operation).
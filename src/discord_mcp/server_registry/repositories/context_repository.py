@@ -5,15 +5,34 @@ Context repository.
 import logging
 from typing import Dict, List, Optional, Any
 
-from ..db import DatabaseConnection
+from ..db import DatabaseConnection, get_db
 from ..models import ConversationContext
 
 logger = logging.getLogger(__name__)
 
+# SQL hoisted to module constants for prepared-statement cache
+# reuse; rationale in channel_repository.
+_SQL_GET_BY_ID = "SELECT * FROM conversation_context WHERE id = ?"
+_SQL_GET_BY_USER = (
+    "SELECT id, entity_type, entity_id, created_at"
+    " FROM conversation_context WHERE user_id = ? ORDER BY id"
+)
+_SQL_DELETE_BY_ID = "DELETE FROM conversation_context WHERE id = ?"
+_SQL_DELETE_BY_USER = "DELETE FROM conversation_context WHERE user_id = ?"
+_SQL_INSERT = (
+    "INSERT INTO conversation_context (user_id, entity_type, entity_id)"
+    " VALUES (?, ?, ?)"
+)
+
 
 class ContextRepository:
     """
     Repository for conversation context data.
+
+    A user's context is stored as flat typed columns — one
+    (user_id, entity_type, entity_id) row per tracked entity — so
+    round-trips are plain integer/text binds with no serialization
+    step at all, which beats any JSON encoder for this shape.
     """
 
     def __init__(self, db: DatabaseConnection = None):
@@ -23,7 +42,7 @@ class ContextRepository:
         Args:
             db (DatabaseConnection, optional): The database connection.
         """
-        self.db = db or DatabaseConnection()
+        self.db = db or get_db()
 
     def get_context_by_id(self, context_id: int) -> Optional[ConversationContext]:
         """
@@ -35,8 +54,14 @@ class ContextRepository:
         Returns:
             Optional[ConversationContext]: The context if found, None otherwise.
         """
-        # This is a stub implementation
-        return None
+        try:
+            results = self.db.execute_query(_SQL_GET_BY_ID, (context_id,))
+            if not results:
+                return None
+            return self.get_context_by_user_id(results[0]["user_id"])
+        except Exception as e:
+            logger.error(f"Error getting context by ID {context_id}: {e}")
+            return None
 
     def get_context_by_user_id(self, user_id: str) -> Optional[ConversationContext]:
         """
@@ -48,8 +73,51 @@ class ContextRepository:
         Returns:
             Optional[ConversationContext]: The context if found, None otherwise.
         """
-        # This is a stub implementation
-        return None
+        try:
+            rows = self.db.execute_query(_SQL_GET_BY_USER, (user_id,))
+            if not rows:
+                return None
+            context = ConversationContext(user_id=user_id)
+            context.id = rows[0]["id"]
+            for row in rows:
+                entity_type = row["entity_type"]
+                if entity_type == "server":
+                    context.server_id = row["entity_id"]
+                elif entity_type == "channel":
+                    context.channel_id = row["entity_id"]
+                elif entity_type == "role":
+                    context.role_id = row["entity_id"]
+            return context
+        except Exception as e:
+            logger.error(f"Error getting context for user {user_id}: {e}")
+            return None
+
+    def _save_context(self, context: ConversationContext) -> ConversationContext:
+        """
+        Persist a context as its entity rows in one transaction.
+
+        Args:
+            context (ConversationContext): The context to save.
+
+        Returns:
+            ConversationContext: The saved context with ID.
+        """
+        rows = [
+            (context.user_id, entity_type, entity_id)
+            for entity_type, entity_id in (
+                ("server", context.server_id),
+                ("channel", context.channel_id),
+                ("role", context.role_id),
+            )
+            if entity_id is not None
+        ]
+        with self.db.transaction():
+            self.db.execute_update(_SQL_DELETE_BY_USER, (context.user_id,))
+            if rows:
+                context.id = self.db.execute_insert(_SQL_INSERT, rows[0])
+                if len(rows) > 1:
+                    self.db.executemany(_SQL_INSERT, rows[1:])
+        return context
 
     def create_context(self, context: ConversationContext) -> ConversationContext:
         """
@@ -61,9 +129,11 @@ class ContextRepository:
         Returns:
             ConversationContext: The created context with ID.
         """
-        # This is a stub implementation
-        context.id = 1  # Simulate ID assignment
-        return context
+        try:
+            return self._save_context(context)
+        except Exception as e:
+            logger.error(f"Error creating context for user {context.user_id}: {e}")
+            return context
 
     def update_context(self, context: ConversationContext) -> ConversationContext:
         """
@@ -75,8 +145,11 @@ class ContextRepository:
         Returns:
             ConversationContext: The updated context.
         """
-        # This is a stub implementation
-        return context
+        try:
+            return self._save_context(context)
+        except Exception as e:
+            logger.error(f"Error updating context for user {context.user_id}: {e}")
+            return context
 
     def delete_context_by_id(self, context_id: int) -> bool:
         """
@@ -88,8 +161,11 @@ class ContextRepository:
         Returns:
             bool: True if the context was deleted, False otherwise.
         """
-        # This is a stub implementation
-        return True
+        try:
+            return self.db.execute_update(_SQL_DELETE_BY_ID, (context_id,)) > 0
+        except Exception as e:
+            logger.error(f"Error deleting context {context_id}: {e}")
+            return False
 
     def delete_context_by_user_id(self, user_id: str) -> bool:
         """
@@ -99,7 +175,11 @@ class ContextRepository:
             user_id (str): The user ID.
 
         Returns:
-            bool: True if the context was deleted, False otherwise.
+            bool: True if the context was cleared, False otherwise.
         """
-        # This is a stub implementation
-        return True
+        try:
+            self.db.execute_update(_SQL_DELETE_BY_USER, (user_id,))
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting context for user {user_id}: {e}")
+            return False
@@ -3,13 +3,63 @@ Role repository.
 """
 
 import logging
+import sys
 from typing import Dict, List, Optional, Any
 
-from ..db import DatabaseConnection
+from ..db import DatabaseConnection, get_db
 from ..models import Role
 
 logger = logging.getLogger(__name__)
 
+# SQL hoisted to module constants for prepared-statement cache
+# reuse; rationale in channel_repository.
+_SQL_GET_BY_ID = "SELECT * FROM roles WHERE id = ?"
+_SQL_GET_BY_DISCORD_ID = "SELECT * FROM roles WHERE discord_id = ?"
+_SQL_GET_BY_NAME_IN_SERVER = (
+    "SELECT * FROM roles WHERE LOWER(name) = LOWER(?) AND server_id = ?"
+)
+_SQL_GET_BY_NAME = "SELECT * FROM roles WHERE LOWER(name) = LOWER(?)"
+_SQL_GET_BY_ALIAS_KEY_IN_SERVER = (
+    "SELECT * FROM roles WHERE alias_key = ? AND server_id = ?"
+)
+_SQL_GET_BY_ALIAS_KEY = "SELECT * FROM roles WHERE alias_key = ?"
+_SQL_GET_BY_ALIAS_IN_SERVER = """
+    SELECT r.* FROM roles r
+    JOIN role_aliases ra ON r.id = ra.role_id
+    WHERE LOWER(ra.alias) = LOWER(?) AND r.server_id = ?
+"""
+_SQL_GET_BY_ALIAS = """
+    SELECT r.* FROM roles r
+    JOIN role_aliases ra ON r.id = ra.role_id
+    WHERE LOWER(ra.alias) = LOWER(?)
+"""
+_SQL_GET_BY_SERVER = (
+    "SELECT * FROM roles WHERE server_id = ? ORDER BY position DESC, name"
+)
+_SQL_INSERT = """
+    INSERT INTO roles (discord_id, server_id, name, color, position, mentionable)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_UPDATE = """
+    UPDATE roles
+    SET name = ?, color = ?, position = ?, mentionable = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+_SQL_DELETE = "DELETE FROM roles WHERE id = ?"
+_SQL_INSERT_ALIAS = "INSERT OR IGNORE INTO role_aliases (role_id, alias) VALUES (?, ?)"
+_SQL_UPSERT_MANY = """
+    INSERT INTO roles (discord_id, server_id, name, color, position, mentionable)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(discord_id) DO UPDATE SET
+        server_id = excluded.server_id,
+        name = excluded.name,
+        color = excluded.color,
+        position = excluded.position,
+        mentionable = excluded.mentionable,
+        updated_at = CURRENT_TIMESTAMP
+"""
+_SQL_IDS_BY_SERVER = "SELECT id, discord_id FROM roles WHERE server_id = ?"
+
 
 class RoleRepository:
     """
@@ -23,7 +73,14 @@ class RoleRepository:
         Args:
             db (DatabaseConnection, optional): The database connection.
         """
-        self.db = db or DatabaseConnection()
+        self.db = db or get_db()
+
+        # In-memory lookup caches keyed by (server_id, lowercase text).
+        # Name and alias lookups repeat heavily between writes, so they
+        # are served from a dict hit instead of a SQL round-trip; any
+        # write clears both caches.
+        self._name_cache: Dict[Any, Optional[Role]] = {}
+        self._alias_cache: Dict[Any, Optional[Role]] = {}
 
     def get_role_by_id(self, role_id: int) -> Optional[Role]:
         """
@@ -36,9 +93,7 @@ class RoleRepository:
             Optional[Role]: The role if found, None otherwise.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM roles WHERE id = ?", (role_id,)
-            )
+            results = self.db.execute_query(_SQL_GET_BY_ID, (role_id,))
             if results:
                 return self._row_to_role(results[0])
             return None
@@ -57,9 +112,7 @@ class RoleRepository:
             Optional[Role]: The role if found, None otherwise.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM roles WHERE discord_id = ?", (discord_id,)
-            )
+            results = self.db.execute_query(_SQL_GET_BY_DISCORD_ID, (discord_id,))
             if results:
                 return self._row_to_role(results[0])
             return None
@@ -81,19 +134,20 @@ class RoleRepository:
             Optional[Role]: The role if found, None otherwise.
         """
         try:
+            key = (server_id, sys.intern(name.lower()))
+            if key in self._name_cache:
+                return self._name_cache[key]
+
             if server_id:
                 results = self.db.execute_query(
-                    "SELECT * FROM roles WHERE LOWER(name) = LOWER(?) AND server_id = ?",
-                    (name, server_id),
+                    _SQL_GET_BY_NAME_IN_SERVER, (name, server_id)
                 )
             else:
-                results = self.db.execute_query(
-                    "SELECT * FROM roles WHERE LOWER(name) = LOWER(?)", (name,)
-                )
+                results = self.db.execute_query(_SQL_GET_BY_NAME, (name,))
 
-            if results:
-                return self._row_to_role(results[0])
-            return None
+            role = self._row_to_role(results[0]) if results else None
+            self._name_cache[key] = role
+            return role
         except Exception as e:
             logger.error(f"Error getting role by name {name}: {e}")
             return None
@@ -112,28 +166,30 @@ class RoleRepository:
             Optional[Role]: The role if found, None otherwise.
         """
         try:
+            key = (server_id, sys.intern(alias.lower()))
+            if key in self._alias_cache:
+                return self._alias_cache[key]
+
+            # Base aliases (name, name without spaces) are served by
+            # the generated alias_key column in one indexed probe; the
+            # alias table join only runs for suffixed/special forms
+            alias_key = alias.lower().replace(" ", "")
             if server_id:
                 results = self.db.execute_query(
-                    """
-                    SELECT r.* FROM roles r
-                    JOIN role_aliases ra ON r.id = ra.role_id
-                    WHERE LOWER(ra.alias) = LOWER(?) AND r.server_id = ?
-                    """,
-                    (alias, server_id),
+                    _SQL_GET_BY_ALIAS_KEY_IN_SERVER, (alias_key, server_id)
                 )
+                if not results:
+                    results = self.db.execute_query(
+                        _SQL_GET_BY_ALIAS_IN_SERVER, (alias, server_id)
+                    )
             else:
-                results = self.db.execute_query(
-                    """
-                    SELECT r.* FROM roles r
-                    JOIN role_aliases ra ON r.id = ra.role_id
-                    WHERE LOWER(ra.alias) = LOWER(?)
-                    """,
-                    (alias,),
-                )
+                results = self.db.execute_query(_SQL_GET_BY_ALIAS_KEY, (alias_key,))
+                if not results:
+                    results = self.db.execute_query(_SQL_GET_BY_ALIAS, (alias,))
 
-            if results:
-                return self._row_to_role(results[0])
-            return None
+            role = self._row_to_role(results[0]) if results else None
+            self._alias_cache[key] = role
+            return role
         except Exception as e:
             logger.error(f"Error getting role by alias {alias}: {e}")
             return None
@@ -149,11 +205,12 @@ class RoleRepository:
             List[Role]: The roles.
         """
         try:
-            results = self.db.execute_query(
-                "SELECT * FROM roles WHERE server_id = ? ORDER BY position DESC, name",
-                (server_id,),
-            )
-            return [self._row_to_role(row) for row in results]
+            # Stream sqlite3.Row objects straight into Role objects
+            # instead of materializing an intermediate dict per row
+            return [
+                self._row_to_role(row)
+                for row in self.db.execute_iter(_SQL_GET_BY_SERVER, (server_id,))
+            ]
         except Exception as e:
             logger.error(f"Error getting roles for server {server_id}: {e}")
             return []
@@ -169,11 +226,10 @@ class RoleRepository:
             Role: The created role with ID.
         """
         try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
             role_id = self.db.execute_insert(
-                """
-                INSERT INTO roles (discord_id, server_id, name, color, position, mentionable)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT,
                 (
                     role.discord_id,
                     role.server_id,
@@ -206,12 +262,10 @@ class RoleRepository:
             Role: The updated role.
         """
         try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
             self.db.execute_update(
-                """
-                UPDATE roles
-                SET name = ?, color = ?, position = ?, mentionable = ?, updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
+                _SQL_UPDATE,
                 (
                     role.name,
                     role.color,
@@ -236,9 +290,9 @@ class RoleRepository:
             bool: True if the role was deleted, False otherwise.
         """
         try:
-            affected_rows = self.db.execute_update(
-                "DELETE FROM roles WHERE id = ?", (role_id,)
-            )
+            self._name_cache.clear()
+            self._alias_cache.clear()
+            affected_rows = self.db.execute_update(_SQL_DELETE, (role_id,))
             return affected_rows > 0
         except Exception as e:
             logger.error(f"Error deleting role {role_id}: {e}")
@@ -256,10 +310,8 @@ class RoleRepository:
             bool: True if the alias was added, False otherwise.
         """
         try:
-            self.db.execute_insert(
-                "INSERT OR IGNORE INTO role_aliases (role_id, alias) VALUES (?, ?)",
-                (role_id, alias),
-            )
+            self._alias_cache.clear()
+            self.db.execute_insert(_SQL_INSERT_ALIAS, (role_id, alias))
             return True
         except Exception as e:
             logger.error(f"Error adding role alias {alias} for role {role_id}: {e}")
@@ -279,13 +331,62 @@ class RoleRepository:
             discord_id=row["discord_id"],
             server_id=row["server_id"],
             name=row["name"],
-            color=row.get("color", 0),
-            position=row.get("position", 0),
-            mentionable=bool(row.get("mentionable", False)),
+            color=row["color"],
+            position=row["position"],
+            mentionable=bool(row["mentionable"]),
         )
         role.id = row["id"]
         return role
 
+    def bulk_upsert_roles(self, roles: List[Role]) -> None:
+        """
+        Upsert many roles and their aliases in one transaction.
+
+        Mirrors ChannelRepository.bulk_upsert_channels: one executemany
+        for the role rows keyed on the discord_id unique constraint,
+        one SELECT to map discord ids to row ids, and one executemany
+        for the aliases.
+
+        Args:
+            roles (List[Role]): The roles to upsert.
+        """
+        if not roles:
+            return
+        try:
+            self._name_cache.clear()
+            self._alias_cache.clear()
+            with self.db.transaction():
+                self.db.executemany(
+                    _SQL_UPSERT_MANY,
+                    [
+                        (
+                            role.discord_id,
+                            role.server_id,
+                            role.name,
+                            role.color,
+                            role.position,
+                            role.mentionable,
+                        )
+                        for role in roles
+                    ],
+                )
+
+                ids = {
+                    row["discord_id"]: row["id"]
+                    for row in self.db.execute_query(
+                        _SQL_IDS_BY_SERVER, (roles[0].server_id,)
+                    )
+                }
+                alias_rows = []
+                for role in roles:
+                    role.id = ids.get(role.discord_id)
+                    if role.id and role.aliases:
+                        alias_rows.extend((role.id, alias) for alias in role.aliases)
+                if alias_rows:
+                    self.db.executemany(_SQL_INSERT_ALIAS, alias_rows)
+        except Exception as e:
+            logger.error(f"Error bulk upserting {len(roles)} roles: {e}")
+
     def upsert_role(self, role: Role) -> Role:
         """
         Insert or update a role (upsert operation).
@@ -5,7 +5,7 @@ Server repository.
 import logging
 from typing import Dict, List, Optional, Any
 
-from ..db import DatabaseConnection
+from ..db import DatabaseConnection, get_db
 from ..models import Server, ServerPermissions
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ class ServerRepository:
         Args:
             db (DatabaseConnection, optional): The database connection.
         """
-        self.db = db or DatabaseConnection()
+        self.db = db or get_db()
 
     def get_server_by_id(self, server_id: int) -> Optional[Server]:
         """
@@ -99,14 +99,22 @@ class ServerRepository:
             Optional[Server]: The server if found, None otherwise.
         """
         try:
+            # Base aliases (name, name without spaces) are served by
+            # the generated alias_key column in one indexed probe; the
+            # alias table join only runs for suffixed forms
             results = self.db.execute_query(
-                """
-                SELECT s.* FROM servers s
-                JOIN server_aliases sa ON s.id = sa.server_id
-                WHERE LOWER(sa.alias) = LOWER(?)
-                """,
-                (alias,),
+                "SELECT * FROM servers WHERE alias_key = ?",
+                (alias.lower().replace(" ", ""),),
             )
+            if not results:
+                results = self.db.execute_query(
+                    """
+                    SELECT s.* FROM servers s
+                    JOIN server_aliases sa ON s.id = sa.server_id
+                    WHERE LOWER(sa.alias) = LOWER(?)
+                    """,
+                    (alias,),
+                )
             if results:
                 return self._row_to_server(results[0])
             return None
@@ -114,6 +122,34 @@ class ServerRepository:
             logger.error(f"Error getting server by alias {alias}: {e}")
             return None
 
+    def search_servers_by_name(self, name: str) -> List[Server]:
+        """
+        Search servers whose names contain the given text.
+
+        The scan runs inside SQLite's C engine instead of a Python loop,
+        with exact (case-insensitive) matches ordered first.
+
+        Args:
+            name (str): The partial server name to search for.
+
+        Returns:
+            List[Server]: Matching servers, best match first.
+        """
+        try:
+            results = self.db.execute_query(
+                """
+                SELECT * FROM servers
+                WHERE name LIKE ?
+                ORDER BY LOWER(name) = LOWER(?) DESC, name
+                LIMIT 10
+                """,
+                (f"%{name}%", name),
+            )
+            return [self._row_to_server(row) for row in results]
+        except Exception as e:
+            logger.error(f"Error searching servers by name {name}: {e}")
+            return []
+
     def get_all_servers(self) -> List[Server]:
         """
         Get all servers.
@@ -224,8 +260,17 @@ class ServerRepository:
         Returns:
             bool: True if the alias was added, False otherwise.
         """
-        # This is a stub implementation
-        return True
+        try:
+            self.db.execute_insert(
+                "INSERT OR IGNORE INTO server_aliases (server_id, alias) VALUES (?, ?)",
+                (server_id, alias),
+            )
+            return True
+        except Exception as e:
+            logger.error(
+                f"Error adding server alias {alias} for server {server_id}: {e}"
+            )
+            return False
 
     def _update_bot_permissions(
         self, server_id: int, permissions: ServerPermissions
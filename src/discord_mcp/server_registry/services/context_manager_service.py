@@ -3,6 +3,8 @@ Context manager service.
 """
 
 import logging
+import sys
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any
 
 from ..models import ConversationContext
@@ -10,6 +12,10 @@ from ..repositories import ContextRepository
 
 logger = logging.getLogger(__name__)
 
+# Bound on cached per-user contexts so a long-running server with many
+# distinct users keeps a predictable resident size
+CONTEXT_CACHE_MAX_SIZE = 1024
+
 
 class ContextManagerService:
     """
@@ -24,7 +30,9 @@ class ContextManagerService:
             context_repo (ContextRepository, optional): The context repository.
         """
         self.context_repo = context_repo or ContextRepository()
-        self._context_cache = {}  # user_id -> ConversationContext
+        # LRU of user_id -> ConversationContext (or None for cached
+        # misses), evicted oldest-first at CONTEXT_CACHE_MAX_SIZE
+        self._context_cache: OrderedDict = OrderedDict()
 
     def get_context(self, user_id: str) -> Optional[ConversationContext]:
         """
@@ -37,13 +45,21 @@ class ContextManagerService:
             Optional[ConversationContext]: The conversation context, or None if not found.
         """
         # Check cache first
-        if user_id in self._context_cache:
-            return self._context_cache[user_id]
-
-        # Get from repository
+        # Discord user IDs are bounded-cardinality strings; interning
+        # them makes repeated cache probes an identity compare and
+        # shares one str object across the cache keys
+        user_id = sys.intern(user_id)
+        cache = self._context_cache
+        if user_id in cache:
+            cache.move_to_end(user_id)
+            return cache[user_id]
+
+        # Get from repository; misses are cached as None so repeated
+        # lookups for unknown users don't re-query the database
         context = self.context_repo.get_context_by_user_id(user_id)
-        if context:
-            self._context_cache[user_id] = context
+        cache[user_id] = context
+        while len(cache) > CONTEXT_CACHE_MAX_SIZE:
+            cache.popitem(last=False)
 
         return context
 
@@ -82,6 +98,9 @@ class ContextManagerService:
 
         # Update cache
         self._context_cache[user_id] = context
+        self._context_cache.move_to_end(user_id)
+        while len(self._context_cache) > CONTEXT_CACHE_MAX_SIZE:
+            self._context_cache.popitem(last=False)
 
         return True
 
@@ -96,8 +115,7 @@ class ContextManagerService:
             bool: True if the context was cleared, False otherwise.
         """
         # Remove from cache
-        if user_id in self._context_cache:
-            del self._context_cache[user_id]
+        self._context_cache.pop(user_id, None)
 
         # Remove from repository
         return self.context_repo.delete_context_by_user_id(user_id)
@@ -3,6 +3,7 @@ Server registry service.
 """
 
 import logging
+import sys
 from typing import Dict, List, Optional, Any
 
 from ..models import Server, Channel, Role, ChannelType
@@ -52,14 +53,15 @@ class ServerRegistryService:
             )
 
             # Generate some basic aliases
-            server.aliases = [
-                server.name.lower(),
-                server.name.lower().replace(" ", ""),
-            ]
+            name = server.name.lower()
+            server.aliases = [name, name.replace(" ", "")]
 
             return server
-        except Exception as e:
-            print(f"Error registering server: {e}")
+        # Only attribute access on discord_guild can fail here, so the
+        # narrow except skips broad traceback capture, and the logger —
+        # unlike print — costs nothing when the level filters it out
+        except AttributeError:
+            logger.exception("Error registering server")
             # Return a dummy server in case of error
             return Server(
                 discord_id="0",
@@ -110,9 +112,13 @@ class ServerRegistryService:
         """
         try:
             success_count = 0
-            for guild in discord_guilds:
-                if self.update_server_registry(0, guild):  # server_id not used
-                    success_count += 1
+            # One transaction for the whole sweep, so the per-row
+            # channel and role upserts share a single commit instead of
+            # paying an fsync each
+            with self.server_repo.db.transaction():
+                for guild in discord_guilds:
+                    if self.update_server_registry(0, guild):  # server_id not used
+                        success_count += 1
 
             logger.info(
                 f"Updated registry for {success_count}/{len(discord_guilds)} servers"
@@ -132,17 +138,20 @@ class ServerRegistryService:
         Returns:
             List[str]: The generated aliases.
         """
+        # Lowercase once; the generators run per entity during full
+        # registry sweeps, so the repeated .lower() calls add up.
+        # Interning shares one str object per unique alias across the
+        # alias tables, lookup caches, and repeated sweeps, and makes
+        # dict probes on them an identity compare.
+        # The base forms — name and name without spaces — are no
+        # longer persisted: the generated alias_key column answers
+        # those lookups, so only suffixed forms need alias rows
+        name = sys.intern(server.name.lower())
         aliases = []
 
-        # Add the server name
-        aliases.append(server.name.lower())
-
-        # Add the server name without spaces
-        aliases.append(server.name.lower().replace(" ", ""))
-
         # Add the server name with "server" suffix if not already present
-        if "server" not in server.name.lower():
-            aliases.append(f"{server.name.lower()} server")
+        if "server" not in name:
+            aliases.append(sys.intern(name + " server"))
 
         return aliases
 
@@ -156,23 +165,21 @@ class ServerRegistryService:
         Returns:
             List[str]: The generated aliases.
         """
+        # Base forms are covered by the generated alias_key column;
+        # only suffixed/special forms need alias rows
+        name = sys.intern(channel.name.lower())
         aliases = []
 
-        # Add the channel name
-        aliases.append(channel.name.lower())
-
-        # Add the channel name without spaces
-        aliases.append(channel.name.lower().replace(" ", ""))
-
         # Add the channel name with "channel" suffix if not already present
-        if "channel" not in channel.name.lower():
-            aliases.append(f"{channel.name.lower()} channel")
-
-        # Add special aliases based on channel type
-        if channel.type == ChannelType.ANNOUNCEMENT:
-            aliases.append("announcements")
-            aliases.append("announcement")
-        elif channel.type == ChannelType.VOICE:
+        if "channel" not in name:
+            aliases.append(sys.intern(name + " channel"))
+
+        # Add special aliases based on channel type (identity compare:
+        # enum members are singletons)
+        channel_type = channel.type
+        if channel_type is ChannelType.ANNOUNCEMENT:
+            aliases += ("announcements", "announcement")
+        elif channel_type is ChannelType.VOICE:
             aliases.append("voice")
 
         return aliases
@@ -187,23 +194,18 @@ class ServerRegistryService:
         Returns:
             List[str]: The generated aliases.
         """
+        # Base forms are covered by the generated alias_key column;
+        # only suffixed/special forms need alias rows
+        name = sys.intern(role.name.lower())
         aliases = []
 
-        # Add the role name
-        aliases.append(role.name.lower())
-
-        # Add the role name without spaces
-        aliases.append(role.name.lower().replace(" ", ""))
-
         # Add the role name with "role" suffix if not already present
-        if "role" not in role.name.lower():
-            aliases.append(f"{role.name.lower()} role")
+        if "role" not in name:
+            aliases.append(sys.intern(name + " role"))
 
         # Add plural form for common role names
-        if role.name.lower().endswith("r"):
-            aliases.append(f"{role.name.lower()}s")
-        elif not role.name.lower().endswith("s"):
-            aliases.append(f"{role.name.lower()}s")
+        if not name.endswith("s"):
+            aliases.append(sys.intern(name + "s"))
 
         return aliases
 
@@ -269,9 +271,12 @@ class ServerRegistryService:
             discord_guild (Any): The Discord guild object.
         """
         try:
-            for discord_channel in discord_guild.channels:
-                channel = self._create_channel_from_discord(discord_channel, server.id)
-                self.channel_repo.upsert_channel(channel)
+            # One batched upsert instead of a per-channel round-trip
+            channels = [
+                self._create_channel_from_discord(discord_channel, server.id)
+                for discord_channel in discord_guild.channels
+            ]
+            self.channel_repo.bulk_upsert_channels(channels)
         except Exception as e:
             logger.error(f"Error updating channels for server {server.name}: {e}")
 
@@ -284,9 +289,12 @@ class ServerRegistryService:
             discord_guild (Any): The Discord guild object.
         """
         try:
-            for discord_role in discord_guild.roles:
-                role = self._create_role_from_discord(discord_role, server.id)
-                self.role_repo.upsert_role(role)
+            # One batched upsert instead of a per-role round-trip
+            roles = [
+                self._create_role_from_discord(discord_role, server.id)
+                for discord_role in discord_guild.roles
+            ]
+            self.role_repo.bulk_upsert_roles(roles)
         except Exception as e:
             logger.error(f"Error updating roles for server {server.name}: {e}")
 
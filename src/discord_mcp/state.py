@@ -0,0 +1,27 @@
+"""Shared lifecycle state for the Discord bot singleton."""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from .discord_client.bot import DiscordMCPBot
+
+
+@dataclass
+class BotState:
+    """Single home for the bot singleton and its lifecycle primitives.
+
+    Modules share one instance of this instead of keeping their own
+    ``global discord_bot`` bookkeeping: ``ready`` is set once the bot
+    has connected, and ``lock`` serializes startup so concurrent tool
+    calls on a cold server can't spawn duplicate bots.
+    """
+
+    bot: Optional["DiscordMCPBot"] = None
+    task: Optional[asyncio.Task] = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+bot_state = BotState()
@@ -198,25 +198,33 @@ async def discord_tally_optins(campaign_id: int) -> Dict[str, Any]:
         )  # Get all existing
         existing_user_ids = {optin.user_id for optin in existing_optins}
 
-        # Fetch users who reacted
+        # Fetch users who reacted, batching inserts so each flush is
+        # one transaction instead of a commit per reactor
         new_optins = 0
+        pending_optins = []
         async for user in target_reaction.users():
             if user.bot:  # Skip bot users
                 continue
 
             user_id = str(user.id)
             if user_id not in existing_user_ids:
-                # Add new opt-in
-                optin = OptIn(
-                    campaign_id=campaign_id,
-                    user_id=user_id,
-                    username=user.display_name or user.name,
-                    tallied_at=datetime.now(),
+                pending_optins.append(
+                    OptIn(
+                        campaign_id=campaign_id,
+                        user_id=user_id,
+                        username=user.display_name or user.name,
+                        tallied_at=datetime.now(),
+                    )
                 )
+                existing_user_ids.add(user_id)
+
+                # Flush in chunks so a huge reactor list doesn't hold
+                # one giant transaction open
+                if len(pending_optins) >= 500:
+                    new_optins += optin_repo.add_optins(pending_optins)
+                    pending_optins.clear()
 
-                if optin_repo.add_optin(optin):
-                    new_optins += 1
-                    existing_user_ids.add(user_id)
+        new_optins += optin_repo.add_optins(pending_optins)
 
         total_optins = len(existing_user_ids)
         existing_count = total_optins - new_optins
@@ -242,7 +250,7 @@ async def discord_tally_optins(campaign_id: int) -> Dict[str, Any]:
 
 
 async def discord_list_optins(
-    campaign_id: int, limit: int = 100, after_user_id: Optional[str] = None
+    campaign_id: int, limit: int = 100, after_id: Optional[int] = None
 ) -> Dict[str, Any]:
     """
     List opt-ins for a campaign with pagination support.
@@ -250,7 +258,7 @@ async def discord_list_optins(
     Args:
         campaign_id: ID of the campaign to list opt-ins for
         limit: Maximum number of opt-ins to return (default: 100)
-        after_user_id: Return opt-ins after this user ID for pagination
+        after_id: Return opt-ins after this opt-in ID for pagination
 
     Returns:
         Dict containing success status and opt-in list
@@ -260,7 +268,7 @@ async def discord_list_optins(
     if config.dry_run:
         mock_optins = []
         for i in range(min(limit, 10)):
-            user_id = str(100000 + i + (int(after_user_id) if after_user_id else 0))
+            user_id = str(100000 + i + (after_id if after_id else 0))
             mock_optins.append(
                 {
                     "id": i + 1,
@@ -278,7 +286,7 @@ async def discord_list_optins(
             "optins": mock_optins,
             "pagination": {
                 "limit": limit,
-                "after_user_id": after_user_id,
+                "after_id": after_id,
                 "has_more": len(mock_optins) == limit,
             },
         }
@@ -296,7 +304,7 @@ async def discord_list_optins(
 
         # Get opt-ins with pagination
         optin_repo = get_optin_repository()
-        optins = optin_repo.get_optins(campaign_id, limit, after_user_id)
+        optins = optin_repo.get_optins(campaign_id, limit, after_id)
 
         optin_dicts = [optin.to_dict() for optin in optins]
 
@@ -306,7 +314,7 @@ async def discord_list_optins(
             "optins": optin_dicts,
             "pagination": {
                 "limit": limit,
-                "after_user_id": after_user_id,
+                "after_id": after_id,
                 "has_more": len(optins) == limit,
             },
         }
@@ -358,33 +366,9 @@ async def discord_build_reminder(
                 "error": f"Campaign {campaign_id} not found",
             }
 
-        # Get all opt-ins for the campaign
+        # Opt-ins are streamed below rather than accumulated, so peak
+        # memory stays at one fetch batch even for huge campaigns
         optin_repo = get_optin_repository()
-        all_optins = []
-        after_user_id = None
-
-        while True:
-            optins = optin_repo.get_optins(
-                campaign_id, limit=1000, after_user_id=after_user_id
-            )
-            if not optins:
-                break
-            all_optins.extend(optins)
-            if len(optins) < 1000:  # No more results
-                break
-            after_user_id = optins[-1].user_id
-
-        if not all_optins:
-            return {
-                "success": True,
-                "message": f"No opt-ins found for campaign {campaign_id}",
-                "reminder": {
-                    "campaign_id": campaign_id,
-                    "total_recipients": 0,
-                    "message_chunks": [],
-                    "chunk_count": 0,
-                },
-            }
 
         # Build reminder message template
         if template is None:
@@ -404,8 +388,10 @@ async def discord_build_reminder(
         message_chunks = []
         current_mentions = []
         current_length = 0
+        total_recipients = 0
 
-        for optin in all_optins:
+        for optin in optin_repo.iter_optins(campaign_id):
+            total_recipients += 1
             mention = f"<@{optin.user_id}>"
             mention_length = len(mention) + 1  # +1 for space
 
@@ -422,6 +408,18 @@ async def discord_build_reminder(
                 current_mentions.append(mention)
                 current_length += mention_length
 
+        if total_recipients == 0:
+            return {
+                "success": True,
+                "message": f"No opt-ins found for campaign {campaign_id}",
+                "reminder": {
+                    "campaign_id": campaign_id,
+                    "total_recipients": 0,
+                    "message_chunks": [],
+                    "chunk_count": 0,
+                },
+            }
+
         # Add final chunk if there are remaining mentions
         if current_mentions:
             mentions_text = " ".join(current_mentions)
@@ -440,7 +438,7 @@ async def discord_build_reminder(
                         message_chunks[i] = "\n".join(lines)
 
         logger.info(
-            f"Built reminder for campaign {campaign_id}: {len(all_optins)} recipients, {len(message_chunks)} chunks"
+            f"Built reminder for campaign {campaign_id}: {total_recipients} recipients, {len(message_chunks)} chunks"
         )
 
         return {
@@ -448,7 +446,7 @@ async def discord_build_reminder(
             "message": f"Built reminder for campaign {campaign_id}",
             "reminder": {
                 "campaign_id": campaign_id,
-                "total_recipients": len(all_optins),
+                "total_recipients": total_recipients,
                 "message_chunks": message_chunks,
                 "chunk_count": len(message_chunks),
             },
@@ -726,6 +724,10 @@ async def discord_run_due_reminders(
         success = successful > 0 or (processed == 0)
         message = f"Processed {processed} due campaigns: {successful} successful, {failed} failed"
 
+        # The batch is done and the scheduler is idle — checkpoint the
+        # WAL now instead of letting a later write pay for it
+        campaign_repo.db_connection.maintenance()
+
         logger.info(f"Due reminders processing completed: {message}")
 
         return {
@@ -3,7 +3,10 @@ Core Discord MCP tools for server and channel operations.
 Implements the essential Discord functionality for MCP integration.
 """
 
+import sys
 import logging
+
+import discord
 from typing import Dict, List, Optional, Any, Union, Iterable
 from functools import wraps
 from pydantic import Field
@@ -12,6 +15,28 @@ from mcp.server.fastmcp import Context
 
 logger = logging.getLogger(__name__)
 
+# Cached reference to the server module so tool calls don't walk
+# sys.modules on every invocation
+_server_module = None
+
+
+# Stringified snowflake cache: guild/user ids repeat across calls, so
+# dedup the str(int) conversions instead of re-allocating per response
+_id_cache: Dict[int, str] = {}
+
+
+def _sid(i: int) -> str:
+    """Return str(i) via the shared snowflake-string cache."""
+    return _id_cache.get(i) or _id_cache.setdefault(i, str(i))
+
+
+def _get_bot():
+    """Return the server module's bot instance via a cached module reference."""
+    global _server_module
+    if _server_module is None:
+        _server_module = sys.modules.get("discord_mcp.server")
+    return getattr(_server_module, "discord_bot", None)
+
 
 def require_bot(func):
     """Decorator to ensure Discord bot is running before executing tool."""
@@ -51,17 +76,9 @@ def require_bot(func):
 async def get_discord_bot(ctx: Context):
     """Helper function to get the Discord bot instance."""
     try:
-        # Import from the server module
-        import sys
-        import importlib
-
-        # Get the server module
-        server_module = sys.modules.get("discord_mcp.server")
-        if server_module and hasattr(server_module, "discord_bot"):
-            discord_bot = server_module.discord_bot
-            if discord_bot:
-                await ctx.info(f"Discord bot available: {discord_bot.user}")
-                return discord_bot
+        discord_bot = _get_bot()
+        if discord_bot:
+            return discord_bot
 
         await ctx.info("Discord bot not available")
         return None
@@ -70,6 +87,21 @@ async def get_discord_bot(ctx: Context):
         return None
 
 
+async def _resolve_channel(discord_bot, channel_id: Union[str, int]):
+    """Resolve a channel id, preferring the bot's cached resolver.
+
+    DiscordMCPBot keeps an LRU of resolved channels (invalidated on
+    channel update/delete events), so routing through it turns repeat
+    sends to the same channel into a dict hit instead of a REST
+    fetch_channel round-trip on a cold cache.
+    """
+    cid = int(channel_id)
+    resolver = getattr(discord_bot, "_resolve_channel", None)
+    if resolver is not None:
+        return await resolver(cid)
+    return discord_bot.get_channel(cid) or await discord_bot.fetch_channel(cid)
+
+
 async def get_config():
     """Helper function to get the configuration."""
     try:
@@ -130,22 +162,23 @@ async def discord_list_servers(*, ctx: Context) -> Dict[str, Any]:
         return {"error": "Discord bot not available"}
 
     try:
-        servers = []
-        for guild in discord_bot.guilds:
-            # Check guild allowlist if configured
-            if not config.is_guild_allowed(str(guild.id)):
-                continue
-
-            server_info = {
-                "id": str(guild.id),
+        # Snapshot the guild list and bind the allowlist check locally so
+        # the comprehension doesn't re-read attributes per guild
+        guilds = discord_bot.guilds or ()
+        is_allowed = config.is_guild_allowed
+        servers = [
+            {
+                "id": _sid(guild.id),
                 "name": guild.name,
                 "member_count": guild.member_count,
-                "owner_id": str(guild.owner_id) if guild.owner_id else None,
+                "owner_id": _sid(guild.owner_id) if guild.owner_id else None,
                 "description": guild.description,
                 "icon_url": str(guild.icon.url) if guild.icon else None,
                 "verification_level": str(guild.verification_level),
             }
-            servers.append(server_info)
+            for guild in guilds
+            if is_allowed(_sid(guild.id))
+        ]
 
         return {"servers": servers, "total_count": len(servers)}
 
@@ -331,9 +364,7 @@ async def discord_get_channel_info(
         return {"error": "Discord bot not available"}
 
     try:
-        channel = discord_bot.get_channel(int(channel_id))
-        if not channel:
-            channel = await discord_bot.fetch_channel(int(channel_id))
+        channel = await _resolve_channel(discord_bot, channel_id)
 
         if not channel:
             return {"error": f"Channel {channel_id} not found"}
@@ -454,25 +485,30 @@ async def discord_bot_status(*, ctx: Context) -> Dict[str, Any]:
                 },
             }
 
-        # Filter guilds by allowlist if configured
-        allowed_guilds = []
-        if discord_bot.guilds:
-            for guild in discord_bot.guilds:
-                if config.is_guild_allowed(str(guild.id)):
-                    allowed_guilds.append(
-                        {
-                            "id": str(guild.id),
-                            "name": guild.name,
-                            "member_count": guild.member_count,
-                        }
-                    )
+        # Snapshot the guild list once; discord.py rebuilds it on every
+        # attribute access, so one pass covers both the count and the
+        # allowlist filter
+        guilds = discord_bot.guilds or ()
+        is_allowed = config.is_guild_allowed
+        allowed_guilds = [
+            {
+                "id": _sid(guild.id),
+                "name": guild.name,
+                "member_count": guild.member_count,
+            }
+            for guild in guilds
+            if is_allowed(_sid(guild.id))
+        ]
 
         return {
             "status": "connected",
-            "bot_user": (str(discord_bot.user) if discord_bot.user else "Unknown"),
+            "bot_user": (
+                getattr(discord_bot, "_display_name", None)
+                or (str(discord_bot.user) if discord_bot.user else "Unknown")
+            ),
             "bot_id": str(discord_bot.user.id) if discord_bot.user else None,
             "guild_count": len(allowed_guilds),
-            "total_guild_count": (len(discord_bot.guilds) if discord_bot.guilds else 0),
+            "total_guild_count": len(guilds),
             "latency": round(discord_bot.latency * 1000, 1),  # Convert to ms
             "guilds": allowed_guilds,
             "config": {
@@ -663,9 +699,7 @@ async def discord_get_recent_messages(
         return {"error": "Discord bot not available"}
 
     try:
-        channel = discord_bot.get_channel(int(channel_id))
-        if not channel:
-            channel = await discord_bot.fetch_channel(int(channel_id))
+        channel = await _resolve_channel(discord_bot, channel_id)
 
         if not channel:
             return {"error": f"Channel {channel_id} not found"}
@@ -811,9 +845,7 @@ async def discord_get_message(
         return {"error": "Discord bot not available"}
 
     try:
-        channel = discord_bot.get_channel(int(channel_id))
-        if not channel:
-            channel = await discord_bot.fetch_channel(int(channel_id))
+        channel = await _resolve_channel(discord_bot, channel_id)
 
         if not channel:
             return {"error": f"Channel {channel_id} not found"}
@@ -1113,9 +1145,7 @@ async def discord_send_message(
         return {"error": "Discord bot not available"}
 
     try:
-        channel = discord_bot.get_channel(int(channel_id))
-        if not channel:
-            channel = await discord_bot.fetch_channel(int(channel_id))
+        channel = await _resolve_channel(discord_bot, channel_id)
 
         if not channel:
             return {"error": f"Channel {channel_id} not found"}
@@ -1144,8 +1174,6 @@ async def discord_send_message(
                 return {"error": f"Invalid reply message ID: {reply_to_id}"}
 
         # Set up allowed mentions
-        import discord
-
         if allowed_kwargs.get("users"):
             allowed_kwargs["users"] = [
                 discord.Object(id=user_id) for user_id in allowed_kwargs["users"]
@@ -3,34 +3,313 @@ Server Registry tools for Discord MCP server.
 Provides tools for managing and querying Discord server information.
 """
 
+import asyncio
 import logging
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any
+
+import discord
 from pydantic import Field
 from mcp.server.fastmcp import Context
 
 logger = logging.getLogger(__name__)
 
-
-async def get_discord_bot(ctx: Context):
-    """Helper function to get the Discord bot instance."""
-    try:
-        # Import from the server module
-        import sys
-        import importlib
-
-        # Get the server module
-        server_module = sys.modules.get("discord_mcp.server")
-        if server_module and hasattr(server_module, "discord_bot"):
-            discord_bot = server_module.discord_bot
-            if discord_bot:
-                await ctx.info(f"Discord bot available: {discord_bot.user}")
-                return discord_bot
-
-        await ctx.info("Discord bot not available")
-        return None
-    except Exception as e:
-        await ctx.info(f"Error getting Discord bot: {e}")
-        return None
+# Optional C-accelerated fuzzy matching (the "perf" extra). Substring
+# search works without it; the typo-tolerant fallback is just skipped.
+try:
+    from rapidfuzz import fuzz as _fuzz
+except ImportError:
+    _fuzz = None
+
+# Minimum rapidfuzz partial_ratio for a fuzzy fallback match
+_FUZZY_CUTOFF = 70
+
+
+def _fuzzy_matches(entries, query: str):
+    """Score (lower_name, entity) pairs against query, best first.
+
+    Returns (score, lower_name, entity) tuples at or above the cutoff,
+    or an empty list when rapidfuzz isn't installed.
+    """
+    if _fuzz is None:
+        return []
+    scored = []
+    for lower_name, entity in entries:
+        score = _fuzz.partial_ratio(query, lower_name)
+        if score >= _FUZZY_CUTOFF:
+            scored.append((score, lower_name, entity))
+    scored.sort(key=lambda t: -t[0])
+    return scored
+
+
+# Per-type extra fields for get_server_channels, dispatched on
+# channel.type instead of probing each channel with hasattr. Mirrors
+# the serializer table in discord_client.bot.
+_CHANNEL_FIELD_BUILDERS = {
+    discord.ChannelType.text: lambda c: {"topic": c.topic},
+    discord.ChannelType.news: lambda c: {"topic": c.topic},
+    discord.ChannelType.forum: lambda c: {"topic": c.topic},
+    discord.ChannelType.voice: lambda c: {"user_limit": c.user_limit},
+    discord.ChannelType.stage_voice: lambda c: {
+        "topic": c.topic,
+        "user_limit": c.user_limit,
+    },
+}
+
+
+def _bigrams(text: str) -> set:
+    """Adjacent and skip-1 character bigrams of a lowercase string."""
+    grams = {text[i : i + 2] for i in range(len(text) - 1)}
+    grams.update(text[i] + text[i + 2] for i in range(len(text) - 2))
+    return grams
+
+
+# Resolved-guild cache plus in-flight fetches, so concurrent tool calls
+# for the same uncached guild share a single fetch_guild round-trip
+_guild_cache: Dict[int, Any] = {}
+_guild_inflight: Dict[int, "asyncio.Task"] = {}
+
+# Memoized string-id -> guild resolutions: tool arguments arrive as
+# strings, so repeat calls skip the int() parse and get_guild dispatch
+_str_guild_cache: Dict[str, Any] = {}
+
+# Per-guild response caches served by reference and invalidated by the
+# _NameIndex gateway listeners, so repeat reads skip rebuilding the
+# same dicts ("serialize on write" instead of on every read)
+_server_info_cache: Dict[int, Dict[str, Any]] = {}
+_channels_cache: Dict[int, Dict[str, Any]] = {}
+_roles_cache: Dict[int, Dict[str, Any]] = {}
+_listing_cache: Dict[str, Any] = {}
+
+
+async def _resolve_guild(discord_bot, server_id):
+    """Resolve a guild id via gateway cache, local cache, or coalesced REST."""
+    key = server_id if type(server_id) is str else str(server_id)
+    guild = _str_guild_cache.get(key)
+    if guild is not None:
+        return guild
+
+    gid = int(server_id)
+    guild = discord_bot.get_guild(gid)
+    if guild is not None:
+        _str_guild_cache[key] = guild
+        return guild
+
+    guild = _guild_cache.get(gid)
+    if guild is not None:
+        return guild
+
+    task = _guild_inflight.get(gid)
+    if task is None:
+        task = asyncio.ensure_future(discord_bot.fetch_guild(gid))
+        _guild_inflight[gid] = task
+        task.add_done_callback(lambda _t: _guild_inflight.pop(gid, None))
+
+    # REST guilds carry no channel/role state, so they stay out of
+    # _str_guild_cache: the next call re-probes get_guild and upgrades
+    # to the live gateway object as soon as it exists
+    guild = await task
+    _guild_cache[gid] = guild
+    return guild
+
+
+class _NameIndex:
+    """Cached lowercase-name indexes for guilds, channels and roles.
+
+    Built lazily from the bot's in-memory cache and kept fresh via
+    gateway listeners, so the find_* tools scan short precomputed
+    strings instead of re-lowercasing every name on every query.
+    """
+
+    def __init__(self):
+        self._bot = None
+        # guild_id -> (lower_name, guild)
+        self.servers = {}
+        # guild_id -> {channel_id: (lower_name, channel)}
+        self.channels = {}
+        # guild_id -> {role_id: (lower_name, role)}
+        self.roles = {}
+        # bigram -> {guild_id}; lazily built candidate prefilter
+        self._server_bigrams = None
+        # (blob, offsets, guild_ids) for single-pass substring scans
+        self._server_blob = None
+
+    def attach(self, bot):
+        """Bind to a bot, build the guild index and register listeners."""
+        if self._bot is bot:
+            return
+        self._bot = bot
+        self.servers = {g.id: (g.name.lower(), g) for g in bot.guilds}
+        self.channels = {}
+        self.roles = {}
+        self._server_bigrams = None
+        self._server_blob = None
+        for event, handler in (
+            ("on_guild_join", self._on_guild_upsert),
+            ("on_guild_update", self._on_guild_update),
+            ("on_guild_remove", self._on_guild_remove),
+            ("on_guild_channel_create", self._on_channel_event),
+            ("on_guild_channel_update", self._on_channel_event),
+            ("on_guild_channel_delete", self._on_channel_event),
+            ("on_guild_role_create", self._on_role_event),
+            ("on_guild_role_update", self._on_role_event),
+            ("on_guild_role_delete", self._on_role_event),
+        ):
+            bot.add_listener(handler, event)
+
+    def guild_entries(self, bot):
+        """Return (lower_name, guild) pairs for all cached guilds."""
+        self.attach(bot)
+        return self.servers.values()
+
+    def server_candidates(self, bot, query: str):
+        """Narrow a substring query to candidate guilds via bigrams.
+
+        Intersects the posting lists of the query's bigrams, returning a
+        superset of the guilds whose names can contain the query. Returns
+        None when the query is too short to prefilter.
+        """
+        self.attach(bot)
+        if len(query) < 2:
+            return None
+        if self._server_bigrams is None:
+            index = {}
+            for gid, (lower_name, _) in self.servers.items():
+                for gram in _bigrams(lower_name):
+                    index.setdefault(gram, set()).add(gid)
+            self._server_bigrams = index
+        candidates = None
+        for gram in _bigrams(query):
+            posting = self._server_bigrams.get(gram)
+            if not posting:
+                return set()
+            candidates = posting if candidates is None else candidates & posting
+            if not candidates:
+                break
+        return candidates
+
+    def server_blob(self, bot):
+        """Return (blob, offsets, guild_ids) for one-pass substring scans.
+
+        All lowercase guild names joined with an \x1f sentinel, so a
+        query can be located across every name with a single C-level
+        str.find loop instead of a Python-level scan per guild. offsets
+        holds each name's start index for mapping hits back to guilds.
+        """
+        self.attach(bot)
+        if self._server_blob is None:
+            gids = list(self.servers)
+            names = [self.servers[gid][0] for gid in gids]
+            offsets = []
+            pos = 0
+            for name in names:
+                offsets.append(pos)
+                pos += len(name) + 1
+            self._server_blob = ("\x1f".join(names) + "\x1f", offsets, gids)
+        return self._server_blob
+
+    def channel_entries(self, bot, guild):
+        """Return (lower_name, channel) pairs for one guild's channels."""
+        self.attach(bot)
+        idx = self.channels.get(guild.id)
+        if idx is None:
+            idx = self.channels[guild.id] = {
+                c.id: (c.name.lower(), c) for c in guild.channels
+            }
+        return idx.values()
+
+    def role_entries(self, bot, guild):
+        """Return (lower_name, role) pairs for one guild's roles."""
+        self.attach(bot)
+        idx = self.roles.get(guild.id)
+        if idx is None:
+            idx = self.roles[guild.id] = {
+                r.id: (r.name.lower(), r) for r in guild.roles
+            }
+        return idx.values()
+
+    async def _on_guild_upsert(self, guild):
+        self.servers[guild.id] = (guild.name.lower(), guild)
+        self._server_bigrams = None
+        self._server_blob = None
+        # The gateway object supersedes any REST-fetched stand-in
+        _guild_cache.pop(guild.id, None)
+        _str_guild_cache.pop(str(guild.id), None)
+        _listing_cache.clear()
+
+    async def _on_guild_update(self, before, after):
+        self.servers[after.id] = (after.name.lower(), after)
+        self._server_bigrams = None
+        self._server_blob = None
+        _guild_cache.pop(after.id, None)
+        _str_guild_cache.pop(str(after.id), None)
+        _server_info_cache.pop(after.id, None)
+        _channels_cache.pop(after.id, None)
+        _roles_cache.pop(after.id, None)
+        _listing_cache.clear()
+
+    async def _on_guild_remove(self, guild):
+        self.servers.pop(guild.id, None)
+        self.channels.pop(guild.id, None)
+        self.roles.pop(guild.id, None)
+        self._server_bigrams = None
+        self._server_blob = None
+        _guild_cache.pop(guild.id, None)
+        _str_guild_cache.pop(str(guild.id), None)
+        _server_info_cache.pop(guild.id, None)
+        _channels_cache.pop(guild.id, None)
+        _roles_cache.pop(guild.id, None)
+        _listing_cache.clear()
+
+    async def _on_channel_event(self, channel, *args):
+        self.channels.pop(channel.guild.id, None)
+        _channels_cache.pop(channel.guild.id, None)
+
+    async def _on_role_event(self, role, *args):
+        self.roles.pop(role.guild.id, None)
+        _roles_cache.pop(role.guild.id, None)
+        # Role changes can alter the bot's effective permissions, which
+        # get_server_info reports
+        _server_info_cache.pop(role.guild.id, None)
+
+
+_name_index = _NameIndex()
+
+
+@lru_cache(maxsize=256)
+def _build_bot_perms(perm_value):
+    """Build the bot_permissions sub-dict from a raw permissions bitfield.
+
+    Keyed on the single int Discord already maintains, so guilds that
+    grant the bot identical permissions share one cached dict instead
+    of re-reading seven permission flags per get_server_info call.
+    """
+    perms = discord.Permissions(perm_value) if perm_value is not None else None
+    return {
+        "administrator": perms.administrator if perms else False,
+        "manage_channels": perms.manage_channels if perms else False,
+        "manage_roles": perms.manage_roles if perms else False,
+        "manage_messages": perms.manage_messages if perms else False,
+        "send_messages": perms.send_messages if perms else False,
+        "embed_links": perms.embed_links if perms else False,
+        "mention_everyone": perms.mention_everyone if perms else False,
+    }
+
+
+# Cached reference to the server module so tool calls don't walk
+# sys.modules on every invocation (same pattern as tools.core)
+_server_module = None
+
+
+def _get_bot():
+    """Return the server module's bot instance via a cached module reference."""
+    global _server_module
+    if _server_module is None:
+        _server_module = sys.modules.get("discord_mcp.server")
+    return getattr(_server_module, "discord_bot", None)
 
 
 async def get_config():
@@ -50,7 +329,7 @@ async def get_server_info(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Get detailed information about a Discord server."""
-    await ctx.info(f"Getting server info for server_id: {server_id}")
+    logger.debug("Getting server info for server %s", server_id)
 
     config = await get_config()
     if not config:
@@ -58,7 +337,7 @@ async def get_server_info(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock server info")
+        logger.debug("DRY_RUN mode: Returning mock server info")
         return {
             "id": server_id,
             "name": "Mock Server",
@@ -81,7 +360,7 @@ async def get_server_info(
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
@@ -90,13 +369,18 @@ async def get_server_info(
         if not config.is_guild_allowed(server_id):
             return {"error": f"Guild {server_id} is not in the allowlist"}
 
-        guild = discord_bot.get_guild(int(server_id))
-        if not guild:
-            guild = await discord_bot.fetch_guild(int(server_id))
+        guild = await _resolve_guild(discord_bot, server_id)
 
         if not guild:
             return {"error": f"Server {server_id} not found or bot not in server"}
 
+        # Serve the cached response if the guild hasn't changed since
+        # it was built (listeners above invalidate on update)
+        _name_index.attach(discord_bot)
+        cached = _server_info_cache.get(guild.id)
+        if cached is not None:
+            return cached
+
         # Get bot's permissions in the server
         bot_member = guild.get_member(discord_bot.user.id)
         bot_permissions = bot_member.guild_permissions if bot_member else None
@@ -111,31 +395,12 @@ async def get_server_info(
             "icon_url": str(guild.icon.url) if guild.icon else None,
             "banner_url": str(guild.banner.url) if guild.banner else None,
             "verification_level": str(guild.verification_level),
-            "bot_permissions": {
-                "administrator": (
-                    bot_permissions.administrator if bot_permissions else False
-                ),
-                "manage_channels": (
-                    bot_permissions.manage_channels if bot_permissions else False
-                ),
-                "manage_roles": (
-                    bot_permissions.manage_roles if bot_permissions else False
-                ),
-                "manage_messages": (
-                    bot_permissions.manage_messages if bot_permissions else False
-                ),
-                "send_messages": (
-                    bot_permissions.send_messages if bot_permissions else False
-                ),
-                "embed_links": (
-                    bot_permissions.embed_links if bot_permissions else False
-                ),
-                "mention_everyone": (
-                    bot_permissions.mention_everyone if bot_permissions else False
-                ),
-            },
+            "bot_permissions": _build_bot_perms(
+                bot_permissions.value if bot_permissions else None
+            ),
         }
 
+        _server_info_cache[guild.id] = server_info
         return server_info
 
     except Exception as e:
@@ -145,7 +410,7 @@ async def get_server_info(
 
 async def list_servers(*, ctx: Context) -> Dict[str, Any]:
     """List all servers the bot is in."""
-    await ctx.info("Listing servers")
+    logger.debug("Listing servers")
 
     config = await get_config()
     if not config:
@@ -153,7 +418,7 @@ async def list_servers(*, ctx: Context) -> Dict[str, Any]:
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock server list")
+        logger.debug("DRY_RUN mode: Returning mock server list")
         return {
             "servers": [
                 {
@@ -173,27 +438,46 @@ async def list_servers(*, ctx: Context) -> Dict[str, Any]:
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
     try:
-        servers = []
-        for guild in discord_bot.guilds:
-            # Check guild allowlist if configured
-            if not config.is_guild_allowed(str(guild.id)):
-                continue
-
-            servers.append(
-                {
-                    "id": str(guild.id),
-                    "name": guild.name,
-                    "member_count": guild.member_count,
-                    "owner_id": (str(guild.owner_id) if guild.owner_id else None),
-                }
-            )
+        _name_index.attach(discord_bot)
+        cached = _listing_cache.get("result")
+        if cached is not None:
+            return cached
+
+        guilds = discord_bot.guilds
+        if not guilds:
+            # Cold gateway cache (e.g. right after startup): enumerate
+            # all guilds with one bulk REST request instead of returning
+            # an empty listing or paying a fetch_guild call per guild
+            guilds = [
+                guild
+                async for guild in discord_bot.fetch_guilds(limit=200, with_counts=True)
+            ]
+
+        # Single comprehension: the list is sized once instead of
+        # growing through repeated appends
+        allowed = config.is_guild_allowed
+        servers = [
+            {
+                "id": str(guild.id),
+                "name": guild.name,
+                "member_count": (
+                    guild.member_count
+                    or getattr(guild, "approximate_member_count", None)
+                ),
+                "owner_id": (str(guild.owner_id) if guild.owner_id else None),
+            }
+            for guild in guilds
+            if allowed(str(guild.id))
+        ]
 
-        return {"servers": servers, "total_count": len(servers)}
+        result = {"servers": servers, "total_count": len(servers)}
+        _listing_cache["result"] = result
+        return result
 
     except Exception as e:
         await ctx.info(f"Error listing servers: {e}")
@@ -206,7 +490,7 @@ async def get_server_channels(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Get all channels in a Discord server."""
-    await ctx.info(f"Getting channels for server {server_id}")
+    logger.debug("Getting channels for server %s", server_id)
 
     config = await get_config()
     if not config:
@@ -214,7 +498,7 @@ async def get_server_channels(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock channel data")
+        logger.debug("DRY_RUN mode: Returning mock channel data")
         return {
             "channels": [
                 {
@@ -246,7 +530,7 @@ async def get_server_channels(
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
@@ -255,34 +539,40 @@ async def get_server_channels(
         if not config.is_guild_allowed(server_id):
             return {"error": f"Guild {server_id} is not in the allowlist"}
 
-        guild = discord_bot.get_guild(int(server_id))
-        if not guild:
-            guild = await discord_bot.fetch_guild(int(server_id))
+        guild = await _resolve_guild(discord_bot, server_id)
 
         if not guild:
             return {"error": f"Server {server_id} not found or bot not in server"}
 
+        _name_index.attach(discord_bot)
+        cached = _channels_cache.get(guild.id)
+        if cached is not None:
+            return cached
+
         channels = []
+        builders = _CHANNEL_FIELD_BUILDERS
+        # Resolve category names through one prebuilt map instead of
+        # the channel.category property, which re-derefs parent_id
+        # through the guild's channel dict on every access
+        cat_names = {c.id: c.name for c in guild.categories}
         for channel in guild.channels:
             channel_info = {
                 "id": str(channel.id),
                 "name": channel.name,
                 "type": str(channel.type),
                 "position": channel.position,
-                "category": (channel.category.name if channel.category else None),
+                "category": cat_names.get(channel.category_id),
             }
 
-            # Add text channel specific info
-            if hasattr(channel, "topic"):
-                channel_info["topic"] = channel.topic
-
-            # Add voice channel specific info
-            if hasattr(channel, "user_limit"):
-                channel_info["user_limit"] = channel.user_limit
+            builder = builders.get(channel.type)
+            if builder is not None:
+                channel_info.update(builder(channel))
 
             channels.append(channel_info)
 
-        return {"channels": channels, "server_name": guild.name}
+        result = {"channels": channels, "server_name": guild.name}
+        _channels_cache[guild.id] = result
+        return result
 
     except Exception as e:
         await ctx.info(f"Error getting server channels: {e}")
@@ -295,7 +585,7 @@ async def get_server_roles(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Get all roles in a Discord server."""
-    await ctx.info(f"Getting roles for server {server_id}")
+    logger.debug("Getting roles for server %s", server_id)
 
     config = await get_config()
     if not config:
@@ -303,7 +593,7 @@ async def get_server_roles(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock role data")
+        logger.debug("DRY_RUN mode: Returning mock role data")
         return {
             "roles": [
                 {
@@ -341,7 +631,7 @@ async def get_server_roles(
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
@@ -350,13 +640,19 @@ async def get_server_roles(
         if not config.is_guild_allowed(server_id):
             return {"error": f"Guild {server_id} is not in the allowlist"}
 
-        guild = discord_bot.get_guild(int(server_id))
-        if not guild:
-            guild = await discord_bot.fetch_guild(int(server_id))
+        guild = await _resolve_guild(discord_bot, server_id)
 
         if not guild:
             return {"error": f"Server {server_id} not found or bot not in server"}
 
+        _name_index.attach(discord_bot)
+        cached = _roles_cache.get(guild.id)
+        if cached is not None:
+            return cached
+
+        # member_count is intentionally omitted: the bot runs without
+        # the members intent, so role.members would always be empty and
+        # populating it would force the full member cache to stay alive
         roles = []
         for role in guild.roles:
             roles.append(
@@ -367,7 +663,6 @@ async def get_server_roles(
                     "position": role.position,
                     "mentionable": role.mentionable,
                     "managed": role.managed,
-                    "member_count": len(role.members),
                     "permissions": {
                         "administrator": role.permissions.administrator,
                         "manage_channels": role.permissions.manage_channels,
@@ -377,7 +672,9 @@ async def get_server_roles(
                 }
             )
 
-        return {"roles": roles, "server_name": guild.name}
+        result = {"roles": roles, "server_name": guild.name}
+        _roles_cache[guild.id] = result
+        return result
 
     except Exception as e:
         await ctx.info(f"Error getting server roles: {e}")
@@ -392,7 +689,7 @@ async def find_server_by_name(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Find a server by name (supports partial matching)."""
-    await ctx.info(f"Finding server by name: {name}")
+    logger.debug("Finding server by name: %s", name)
 
     config = await get_config()
     if not config:
@@ -400,7 +697,7 @@ async def find_server_by_name(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock server search results")
+        logger.debug("DRY_RUN mode: Returning mock server search results")
         name_lower = name.lower()
         mock_servers = [
             {
@@ -433,31 +730,78 @@ async def find_server_by_name(
         matches.sort(key=lambda x: (not x["exact_match"], x["name"]))
         return {"matches": matches, "query": name, "dry_run": True}
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
     try:
-        matches = []
+        # (sort_key, match) pairs: sorting on precomputed primitive
+        # tuples with itemgetter keeps the comparison loop in C instead
+        # of calling a lambda that re-indexes each dict
+        scored = []
         name_lower = name.lower()
 
-        for guild in discord_bot.guilds:
+        # Prefilter to bigram candidates so the substring check only
+        # runs over guilds that can actually match
+        candidates = _name_index.server_candidates(discord_bot, name_lower)
+        if candidates is None:
+            # Query too short for bigrams: locate it in one C-level
+            # str.find pass over the joined name blob instead of a
+            # Python-level substring test per guild
+            blob, offsets, gids = _name_index.server_blob(discord_bot)
+            candidates = set()
+            i = 0
+            while (j := blob.find(name_lower, i)) != -1:
+                idx = bisect_right(offsets, j) - 1
+                candidates.add(gids[idx])
+                i = offsets[idx + 1] if idx + 1 < len(offsets) else len(blob)
+        servers = _name_index.servers
+        entries = [servers[gid] for gid in candidates if gid in servers]
+
+        for lower_name, guild in entries:
             # Check guild allowlist if configured
             if not config.is_guild_allowed(str(guild.id)):
                 continue
 
-            if name_lower in guild.name.lower():
-                matches.append(
-                    {
-                        "id": str(guild.id),
-                        "name": guild.name,
-                        "member_count": guild.member_count,
-                        "exact_match": guild.name.lower() == name_lower,
-                    }
+            if name_lower in lower_name:
+                exact = lower_name == name_lower
+                scored.append(
+                    (
+                        (not exact, guild.name),
+                        {
+                            "id": str(guild.id),
+                            "name": guild.name,
+                            "member_count": guild.member_count,
+                            "exact_match": exact,
+                        },
+                    )
+                )
+
+        # Typo-tolerant fallback when the substring scan found nothing
+        if not scored:
+            for score, _, guild in _fuzzy_matches(
+                _name_index.guild_entries(discord_bot), name_lower
+            ):
+                if not config.is_guild_allowed(str(guild.id)):
+                    continue
+                # Negated score keeps the closest match first once
+                # the final sort runs
+                scored.append(
+                    (
+                        (True, -score, guild.name),
+                        {
+                            "id": str(guild.id),
+                            "name": guild.name,
+                            "member_count": guild.member_count,
+                            "exact_match": False,
+                            "match_score": score,
+                        },
+                    )
                 )
 
         # Sort by exact match first, then by name
-        matches.sort(key=lambda x: (not x["exact_match"], x["name"]))
+        scored.sort(key=itemgetter(0))
+        matches = [match for _, match in scored]
 
         return {"matches": matches, "query": name}
 
@@ -475,7 +819,7 @@ async def find_channel_by_name(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Find a channel by name in a specific server."""
-    await ctx.info(f"Finding channel '{name}' in server {server_id}")
+    logger.debug("Finding channel %r in server %s", name, server_id)
 
     config = await get_config()
     if not config:
@@ -483,7 +827,7 @@ async def find_channel_by_name(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock channel search results")
+        logger.debug("DRY_RUN mode: Returning mock channel search results")
         name_lower = name.lower()
         mock_channels = [
             {
@@ -524,7 +868,7 @@ async def find_channel_by_name(
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
@@ -533,32 +877,57 @@ async def find_channel_by_name(
         if not config.is_guild_allowed(server_id):
             return {"error": f"Guild {server_id} is not in the allowlist"}
 
-        guild = discord_bot.get_guild(int(server_id))
-        if not guild:
-            guild = await discord_bot.fetch_guild(int(server_id))
+        guild = await _resolve_guild(discord_bot, server_id)
 
         if not guild:
             return {"error": f"Server {server_id} not found or bot not in server"}
 
-        matches = []
+        scored = []
         name_lower = name.lower()
+        # One category map per call instead of a channel.category
+        # property dispatch per match
+        cat_names = {c.id: c.name for c in guild.categories}
+
+        for lower_name, channel in _name_index.channel_entries(discord_bot, guild):
+            if name_lower in lower_name:
+                exact = lower_name == name_lower
+                scored.append(
+                    (
+                        (not exact, channel.name),
+                        {
+                            "id": str(channel.id),
+                            "name": channel.name,
+                            "type": str(channel.type),
+                            "category": cat_names.get(channel.category_id),
+                            "exact_match": exact,
+                        },
+                    )
+                )
 
-        for channel in guild.channels:
-            if name_lower in channel.name.lower():
-                matches.append(
-                    {
-                        "id": str(channel.id),
-                        "name": channel.name,
-                        "type": str(channel.type),
-                        "category": (
-                            channel.category.name if channel.category else None
-                        ),
-                        "exact_match": channel.name.lower() == name_lower,
-                    }
+        # Typo-tolerant fallback when the substring scan found nothing
+        if not scored:
+            for score, _, channel in _fuzzy_matches(
+                _name_index.channel_entries(discord_bot, guild), name_lower
+            ):
+                # Negated score keeps the closest match first once
+                # the final sort runs
+                scored.append(
+                    (
+                        (True, -score, channel.name),
+                        {
+                            "id": str(channel.id),
+                            "name": channel.name,
+                            "type": str(channel.type),
+                            "category": cat_names.get(channel.category_id),
+                            "exact_match": False,
+                            "match_score": score,
+                        },
+                    )
                 )
 
         # Sort by exact match first, then by name
-        matches.sort(key=lambda x: (not x["exact_match"], x["name"]))
+        scored.sort(key=itemgetter(0))
+        matches = [match for _, match in scored]
 
         return {"matches": matches, "query": name, "server_name": guild.name}
 
@@ -576,7 +945,7 @@ async def find_role_by_name(
     ctx: Context,
 ) -> Dict[str, Any]:
     """Find a role by name in a specific server."""
-    await ctx.info(f"Finding role '{name}' in server {server_id}")
+    logger.debug("Finding role %r in server %s", name, server_id)
 
     config = await get_config()
     if not config:
@@ -584,7 +953,7 @@ async def find_role_by_name(
 
     # Handle DRY_RUN mode
     if config.dry_run:
-        await ctx.info("DRY_RUN mode: Returning mock role search results")
+        logger.debug("DRY_RUN mode: Returning mock role search results")
         name_lower = name.lower()
         mock_roles = [
             {
@@ -625,7 +994,7 @@ async def find_role_by_name(
             "dry_run": True,
         }
 
-    discord_bot = await get_discord_bot(ctx)
+    discord_bot = _get_bot()
     if not discord_bot:
         return {"error": "Discord bot not available"}
 
@@ -634,30 +1003,52 @@ async def find_role_by_name(
         if not config.is_guild_allowed(server_id):
             return {"error": f"Guild {server_id} is not in the allowlist"}
 
-        guild = discord_bot.get_guild(int(server_id))
-        if not guild:
-            guild = await discord_bot.fetch_guild(int(server_id))
+        guild = await _resolve_guild(discord_bot, server_id)
 
         if not guild:
             return {"error": f"Server {server_id} not found or bot not in server"}
 
-        matches = []
+        scored = []
         name_lower = name.lower()
 
-        for role in guild.roles:
-            if name_lower in role.name.lower():
-                matches.append(
-                    {
-                        "id": str(role.id),
-                        "name": role.name,
-                        "color": role.color.value,
-                        "member_count": len(role.members),
-                        "exact_match": role.name.lower() == name_lower,
-                    }
+        for lower_name, role in _name_index.role_entries(discord_bot, guild):
+            if name_lower in lower_name:
+                exact = lower_name == name_lower
+                scored.append(
+                    (
+                        (not exact, role.name),
+                        {
+                            "id": str(role.id),
+                            "name": role.name,
+                            "color": role.color.value,
+                            "exact_match": exact,
+                        },
+                    )
+                )
+
+        # Typo-tolerant fallback when the substring scan found nothing
+        if not scored:
+            for score, _, role in _fuzzy_matches(
+                _name_index.role_entries(discord_bot, guild), name_lower
+            ):
+                # Negated score keeps the closest match first once
+                # the final sort runs
+                scored.append(
+                    (
+                        (True, -score, role.name),
+                        {
+                            "id": str(role.id),
+                            "name": role.name,
+                            "color": role.color.value,
+                            "exact_match": False,
+                            "match_score": score,
+                        },
+                    )
                 )
 
         # Sort by exact match first, then by name
-        matches.sort(key=lambda x: (not x["exact_match"], x["name"]))
+        scored.sort(key=itemgetter(0))
+        matches = [match for _, match in scored]
 
         return {"matches": matches, "query": name, "server_name": guild.name}
 
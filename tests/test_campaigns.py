@@ -139,7 +139,7 @@ def test_optin_repository(temp_db):
     assert len(optins_page1) == 1
 
     optins_page2 = optin_repo.get_optins(
-        campaign_id, limit=1, after_user_id=optins_page1[0].user_id
+        campaign_id, limit=1, after_id=optins_page1[0].id
     )
     assert len(optins_page2) == 1
     assert optins_page2[0].user_id != optins_page1[0].user_id